@@ -0,0 +1,37 @@
+"""
+Forms package.
+
+Why lazy imports?
+- Each form module pulls in its own WTForms fields and validators
+- A route that only needs LoginForm shouldn't pay for transaction/budget/project forms
+- Forms are imported the first time they're accessed from this package
+
+Example:
+    from app.forms import LoginForm  # imports app.forms.auth only
+"""
+
+import importlib
+
+# Form name -> module that defines it
+_LAZY = {
+    'SignupForm': 'app.forms.auth',
+    'LoginForm': 'app.forms.auth',
+    'TransactionForm': 'app.forms.transaction',
+    'TransactionFilterForm': 'app.forms.transaction',
+    'BudgetGoalForm': 'app.forms.budget',
+    'ProjectForm': 'app.forms.project',
+    'RecurringTransactionForm': 'app.forms.recurring_transaction',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve forms on first access (PEP 562)."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    form_class = getattr(importlib.import_module(module_path), name)
+    globals()[name] = form_class  # Cache so __getattr__ isn't hit again
+    return form_class
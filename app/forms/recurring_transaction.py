@@ -5,7 +5,7 @@ Recurring Transaction Form - Create and manage recurring transactions.
 from flask_wtf import FlaskForm
 from wtforms import DecimalField, SelectField, DateField, StringField, SubmitField, BooleanField
 from wtforms.validators import DataRequired, Optional, Length
-from datetime import date
+from app.utils.dates import today
 from app.validators import DecimalRange, SafeString
 
 
@@ -57,7 +57,7 @@ class RecurringTransactionForm(FlaskForm):
     start_date = DateField(
         'Start Date',
         validators=[DataRequired(message='Start date is required')],
-        default=date.today,
+        default=today,
         render_kw={'class': 'form-control', 'type': 'date'}
     )
     
@@ -11,7 +11,7 @@ Why separate transaction forms?
 from flask_wtf import FlaskForm
 from wtforms import StringField, DecimalField, SelectField, DateField, TextAreaField, SubmitField
 from wtforms.validators import DataRequired, NumberRange, Length, Optional
-from datetime import date
+from app.utils.dates import today
 from app.validators import DecimalRange, SafeString
 
 
@@ -113,7 +113,7 @@ class TransactionForm(FlaskForm):
     transaction_date = DateField(
         'Date',
         validators=[DataRequired(message='Date is required')],
-        default=date.today,
+        default=today,
         render_kw={'class': 'form-control', 'type': 'date'}
     )
     # Why DateField?
@@ -167,7 +167,7 @@ class TransactionForm(FlaskForm):
         """
         from wtforms.validators import ValidationError
         
-        if transaction_date.data and transaction_date.data > date.today():
+        if transaction_date.data and transaction_date.data > today():
             raise ValidationError('Transaction date cannot be in the future')
 
 
@@ -181,6 +181,10 @@ class TransactionFilterForm(FlaskForm):
     - Cleaner separation of concerns
     """
     
+    class Meta:
+        # Read-only GET filter: no CSRF token to generate or verify
+        csrf = False
+    
     category_id = SelectField(
         'Category',
         validators=[Optional()],
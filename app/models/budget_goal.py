@@ -8,9 +8,39 @@ Why this design?
 - Track budget vs actual spending
 """
 
-from datetime import datetime
+import calendar
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from sqlalchemy import event, func
+from sqlalchemy.orm import validates
 from app import db
+from app.models.transaction import Transaction
+
+
+def _weekly_window(today):
+    """Current week, Monday to Sunday."""
+    weekday = today.weekday()
+    return today - timedelta(days=weekday), today + timedelta(days=6 - weekday)
+
+
+def _monthly_window(today):
+    """Current calendar month."""
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    return today.replace(day=1), today.replace(day=last_day)
+
+
+def _yearly_window(today):
+    """Current calendar year."""
+    return today.replace(month=1, day=1), today.replace(month=12, day=31)
+
+
+# Period name -> function returning (start_date, end_date)
+# Why a dict? One lookup instead of an if/elif chain per call
+_PERIOD_WINDOWS = {
+    'weekly': _weekly_window,
+    'monthly': _monthly_window,
+    'yearly': _yearly_window,
+}
 
 
 class BudgetGoal(db.Model):
@@ -167,6 +197,10 @@ class BudgetGoal(db.Model):
         """
         Get total spending for this category in date range.
         
+        Why SUM in SQL?
+        - Database returns one value instead of every matching row
+        - No Transaction objects built just to read their amount
+        
         Args:
             start_date (date): Start of period
             end_date (date): End of period
@@ -174,59 +208,113 @@ class BudgetGoal(db.Model):
         Returns:
             Decimal: Total spending in period
         """
-        from app.models.transaction import Transaction
-        
-        transactions = Transaction.query.filter(
+        return db.session.query(
+            func.coalesce(func.sum(Transaction.amount), Decimal('0.00'))
+        ).filter(
             Transaction.user_id == self.user_id,
             Transaction.category_id == self.category_id,
             Transaction.transaction_type == 'expense',
             Transaction.is_deleted == False,
             Transaction.transaction_date >= start_date,
             Transaction.transaction_date <= end_date
-        ).all()
+        ).scalar()
+    
+    def get_period_window(self, today=None):
+        """
+        Get the start and end dates of the current budget period.
         
-        total = Decimal('0.00')
-        for transaction in transactions:
-            total += transaction.amount
+        Args:
+            today (date): Reference date (defaults to date.today())
+        
+        Returns:
+            tuple: (start_date, end_date)
+        """
+        if today is None:
+            today = date.today()
         
-        return total
+        window = _PERIOD_WINDOWS.get(self.period)
+        if window is None:
+            # Unknown period: month to date
+            return today.replace(day=1), today
+        
+        return window(today)
     
     def get_current_period_spending(self):
         """
         Get spending for current budget period.
         
+        Why cache?
+        - A budget card calls this from 3-5 helpers
+        - Only the first call per period window hits the database
+        - Cleared when the row is refreshed or expired (e.g. by commit),
+          so a transaction committed mid-request is picked up
+        
         Returns:
             Decimal: Total spending in current period
         """
-        from datetime import date, timedelta
+        window = self.get_period_window()
+        cached = self.__dict__.get('_spending')
+        if cached is not None and cached[0] == window:
+            return cached[1]
+        
+        spending = self.get_spending(*window)
+        self._set_cached_spending(window, spending)
+        return spending
+    
+    def _set_cached_spending(self, window, spending):
+        """Store spending for a period window (see get_current_period_spending)."""
+        self.__dict__['_spending'] = (window, spending)
+    
+    @classmethod
+    def get_dashboard(cls, user_id, include_inactive=False):
+        """
+        Load a user's budget goals with current spending pre-filled.
         
+        Why?
+        - Calling get_current_period_spending() per goal costs K queries
+        - Here goals sharing a period window get one GROUP BY category_id query
+        - At most 3 aggregate queries (weekly, monthly, yearly)
+        
+        Args:
+            user_id (int): User ID
+            include_inactive (bool): Also load paused goals (budget list page)
+        
+        Returns:
+            list: BudgetGoal objects whose spending is already cached
+        """
         today = date.today()
+        query = cls.query.filter_by(user_id=user_id)
+        if not include_inactive:
+            query = query.filter_by(is_active=True)
+        goals = query.all()
         
-        if self.period == 'weekly':
-            # Current week (Monday to Sunday)
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-        
-        elif self.period == 'monthly':
-            # Current month
-            start_date = today.replace(day=1)
-            # Last day of month
-            if today.month == 12:
-                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-        
-        elif self.period == 'yearly':
-            # Current year
-            start_date = today.replace(month=1, day=1)
-            end_date = today.replace(month=12, day=31)
+        # Group goals by (start_date, end_date)
+        windows = {}
+        for goal in goals:
+            windows.setdefault(goal.get_period_window(today), []).append(goal)
         
-        else:
-            # Default to monthly
-            start_date = today.replace(day=1)
-            end_date = today
+        for (start_date, end_date), window_goals in windows.items():
+            totals = dict(
+                db.session.query(
+                    Transaction.category_id,
+                    func.sum(Transaction.amount)
+                ).filter(
+                    Transaction.user_id == user_id,
+                    Transaction.category_id.in_([g.category_id for g in window_goals]),
+                    Transaction.transaction_type == 'expense',
+                    Transaction.is_deleted == False,
+                    Transaction.transaction_date >= start_date,
+                    Transaction.transaction_date <= end_date
+                ).group_by(Transaction.category_id).all()
+            )
+            
+            for goal in window_goals:
+                goal._set_cached_spending(
+                    (start_date, end_date),
+                    totals.get(goal.category_id) or Decimal('0.00')
+                )
         
-        return self.get_spending(start_date, end_date)
+        return goals
     
     def get_remaining_budget(self):
         """
@@ -238,6 +326,39 @@ class BudgetGoal(db.Model):
         spending = self.get_current_period_spending()
         return self.amount - spending
     
+    @validates('amount')
+    def validate_amount(self, key, amount):
+        """
+        Reject non-positive amounts before they reach the database.
+        
+        Why?
+        - Mirrors check_positive_budget_amount at the Python boundary
+        - Lets percentage calculations divide by amount without a zero check
+        
+        Raises:
+            ValueError: If amount is zero or negative
+        """
+        if amount is not None and amount <= 0:
+            raise ValueError('Budget amount must be greater than zero')
+        return amount
+    
+    @property
+    def amount_float(self):
+        """
+        Budget amount as a float, converted once per loaded instance.
+        
+        Why cache?
+        - Percentage checks convert the Decimal amount on every call
+        - Cleared when the row is refreshed, expired or amount is set
+        
+        Returns:
+            float: Budget amount
+        """
+        value = self.__dict__.get('_amount_float')
+        if value is None:
+            value = self.__dict__['_amount_float'] = float(self.amount)
+        return value
+    
     def get_percentage_used(self):
         """
         Get percentage of budget used in current period.
@@ -247,10 +368,9 @@ class BudgetGoal(db.Model):
         """
         spending = self.get_current_period_spending()
         
-        if self.amount == 0:
-            return 0.0
-        
-        percentage = (float(spending) / float(self.amount)) * 100
+        # No zero check: check_positive_budget_amount (and validate_amount)
+        # guarantee amount > 0
+        percentage = (float(spending) / self.amount_float) * 100
         return round(percentage, 2)
     
     def is_over_budget(self):
@@ -281,16 +401,37 @@ class BudgetGoal(db.Model):
         """
         Get alert message for user.
         
+        Why not call should_alert()?
+        - It would compute the percentage, then we'd compute it again
+        - Spending and percentage are worked out once and reused
+        - category is joined-loaded with the goal, so .name costs no query
+        
         Returns:
             str: Alert message or None if no alert needed
         """
-        if not self.should_alert():
+        if not self.is_active:
             return None
         
-        percentage = self.get_percentage_used()
         spending = self.get_current_period_spending()
+        percentage = round((float(spending) / self.amount_float) * 100, 2)
         
-        if self.is_over_budget():
+        if percentage < self.alert_threshold:
+            return None
+        
+        return self._format_alert(spending, percentage)
+    
+    def _format_alert(self, spending, percentage):
+        """
+        Build the alert text from already computed figures.
+        
+        Args:
+            spending (Decimal): Spending in current period
+            percentage (float): Percentage of budget used
+        
+        Returns:
+            str: Alert message
+        """
+        if spending > self.amount:
             over_amount = spending - self.amount
             return (
                 f"⚠️ Budget Alert: You've exceeded your {self.period} "
@@ -303,3 +444,31 @@ class BudgetGoal(db.Model):
                 f"{self.period} budget for {self.category.name}. "
                 f"(${spending:.2f} / ${self.amount:.2f})"
             )
+
+
+# Drop the cached float amount whenever the column value may have changed
+@event.listens_for(BudgetGoal, 'refresh')
+def _reset_amount_float_on_refresh(target, context, attrs):
+    target.__dict__.pop('_amount_float', None)
+
+
+@event.listens_for(BudgetGoal, 'expire')
+def _reset_amount_float_on_expire(target, attrs):
+    target.__dict__.pop('_amount_float', None)
+
+
+# Drop cached spending when the goal is reloaded or expired (e.g. on commit),
+# since new transactions may have been written in the meantime
+@event.listens_for(BudgetGoal, 'refresh')
+def _reset_spending_on_refresh(target, context, attrs):
+    target.__dict__.pop('_spending', None)
+
+
+@event.listens_for(BudgetGoal, 'expire')
+def _reset_spending_on_expire(target, attrs):
+    target.__dict__.pop('_spending', None)
+
+
+@event.listens_for(BudgetGoal.amount, 'set')
+def _reset_amount_float_on_set(target, value, oldvalue, initiator):
+    target.__dict__.pop('_amount_float', None)
@@ -15,7 +15,10 @@ Use Cases:
 """
 
 from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import event, func
 from app import db
+from app.models.transaction import Transaction
 
 
 class Project(db.Model):
@@ -99,12 +102,13 @@ class Project(db.Model):
     transactions = db.relationship(
         'Transaction',
         backref='project',
-        lazy='dynamic'
+        lazy='select'
     )
-    # Why lazy='dynamic'?
-    # - Returns query object, not list
-    # - Can filter/paginate transactions
-    # - Example: project.transactions.filter_by(transaction_type='expense').all()
+    # Why lazy='select' instead of 'dynamic'?
+    # - A dynamic query re-runs SQL on every access and can't be eager-loaded
+    # - A plain collection works with selectinload() when listing projects
+    # - Filtered/paginated access goes through active_transactions()
+    # - Still loaded on delete so the ORM can null out project_id
     
     # Note: user relationship is defined in User model via backref
     
@@ -124,13 +128,23 @@ class Project(db.Model):
         status = 'Active' if self.is_active else 'Archived'
         return f'<Project "{self.name}" ({status})>'
     
-    def to_dict(self):
+    def to_dict(self, transaction_count=None):
         """
         Convert project to dictionary (for JSON responses).
         
+        Why accept transaction_count?
+        - Counting here costs one COUNT query per project
+        - List views can pass counts fetched for all projects at once
+        
+        Args:
+            transaction_count (int): Pre-computed count (queried if None)
+        
         Returns:
             dict: Project data
         """
+        if transaction_count is None:
+            transaction_count = Transaction.query.filter_by(project_id=self.id).count()
+        
         return {
             'id': self.id,
             'name': self.name,
@@ -138,52 +152,122 @@ class Project(db.Model):
             'color': self.color,
             'is_active': self.is_active,
             'user_id': self.user_id,
-            'transaction_count': self.transactions.count(),
+            'transaction_count': transaction_count,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
-    def get_total_spending(self):
+    def active_transactions(self):
         """
-        Calculate total spending for this project.
+        Query this project's non-deleted transactions.
         
         Returns:
-            Decimal: Total expenses minus income
+            Query: Filterable/paginatable transaction query
+        
+        Example:
+            project.active_transactions().filter_by(transaction_type='expense').all()
+        """
+        return Transaction.query.filter_by(project_id=self.id, is_deleted=False)
+    
+    @classmethod
+    def list_with_counts(cls, user_id):
         """
-        from decimal import Decimal
+        Load a user's projects with their active transaction counts.
         
-        total_income = sum(
-            t.amount for t in self.transactions.filter_by(transaction_type='income', is_deleted=False).all()
-        ) or Decimal('0')
+        Why?
+        - to_dict() would otherwise run one COUNT query per project
+        - One LEFT JOIN + GROUP BY returns every project and its count
         
-        total_expenses = sum(
-            t.amount for t in self.transactions.filter_by(transaction_type='expense', is_deleted=False).all()
-        ) or Decimal('0')
+        Args:
+            user_id (int): User ID
         
-        return total_expenses - total_income
+        Returns:
+            list: (Project, int) tuples ordered by name
+        
+        Example:
+            [project.to_dict(count) for project, count in Project.list_with_counts(user_id)]
+        """
+        return db.session.query(
+            cls,
+            func.count(Transaction.id)
+        ).outerjoin(
+            Transaction,
+            db.and_(
+                Transaction.project_id == cls.id,
+                Transaction.is_deleted == False
+            )
+        ).filter(
+            cls.user_id == user_id
+        ).group_by(cls.id).order_by(cls.name).all()
     
-    def get_transaction_summary(self):
+    def _totals_by_type(self):
         """
-        Get summary statistics for project transactions.
+        Sum and count active transactions per type in one query.
+        
+        Why GROUP BY in SQL?
+        - Returns at most two rows (income, expense)
+        - No Transaction objects built just to read their amount
+        
+        Why cache on the instance?
+        - Pages showing both total spending and the summary reuse one query
+        - Cleared when the project is expired (every commit) or refreshed
         
         Returns:
-            dict: Summary with income, expenses, net, and count
+            dict: {transaction_type: (Decimal total, int count)}
         """
-        from decimal import Decimal
+        cached = self.__dict__.get('_totals')
+        if cached is not None:
+            return cached
+        
+        rows = db.session.query(
+            Transaction.transaction_type,
+            func.coalesce(func.sum(Transaction.amount), Decimal('0')),
+            func.count(Transaction.id)
+        ).filter(
+            Transaction.project_id == self.id,
+            Transaction.is_deleted == False
+        ).group_by(Transaction.transaction_type).all()
         
-        active_transactions = self.transactions.filter_by(is_deleted=False).all()
+        totals = {transaction_type: (total, count) for transaction_type, total, count in rows}
+        self.__dict__['_totals'] = totals
+        return totals
+    
+    def get_total_spending(self):
+        """
+        Calculate total spending for this project.
         
-        total_income = sum(
-            t.amount for t in active_transactions if t.transaction_type == 'income'
-        ) or Decimal('0')
+        Returns:
+            Decimal: Total expenses minus income
+        """
+        totals = self._totals_by_type()
+        zero = (Decimal('0'), 0)
+        return totals.get('expense', zero)[0] - totals.get('income', zero)[0]
+    
+    def get_transaction_summary(self):
+        """
+        Get summary statistics for project transactions.
         
-        total_expenses = sum(
-            t.amount for t in active_transactions if t.transaction_type == 'expense'
-        ) or Decimal('0')
+        Returns:
+            dict: Summary with income, expenses, net, and count
+        """
+        totals = self._totals_by_type()
+        total_income, income_count = totals.get('income', (Decimal('0'), 0))
+        total_expenses, expense_count = totals.get('expense', (Decimal('0'), 0))
         
         return {
             'total_income': float(total_income),
             'total_expenses': float(total_expenses),
             'net_spending': float(total_expenses - total_income),
-            'transaction_count': len(active_transactions)
+            'transaction_count': income_count + expense_count
         }
+
+
+# Drop cached totals whenever the project's state is reloaded
+@event.listens_for(Project, 'refresh')
+def _reset_totals_on_refresh(target, context, attrs):
+    target.__dict__.pop('_totals', None)
+
+
+@event.listens_for(Project, 'expire')
+def _reset_totals_on_expire(target, attrs):
+    target.__dict__.pop('_totals', None)
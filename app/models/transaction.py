@@ -8,8 +8,9 @@ Why this design?
 - Relationships to User and Category for data organization
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from sqlalchemy import case, func, select
 from app import db
 
 
@@ -157,6 +158,25 @@ class Transaction(db.Model):
             "transaction_type IN ('income', 'expense')",
             name='check_transaction_type'
         ),
+        # Budget spending lookups: user + category over a date range
+        # Why composite? Single-column indexes leave the other filters as row checks
+        # Why partial on Postgres? Deleted rows are never summed, so they're left out
+        db.Index(
+            'ix_txn_user_cat_date',
+            'user_id', 'category_id', 'transaction_date',
+            postgresql_where=db.text('is_deleted = false')
+        ),
+        # Project summaries: totals per type for one project
+        db.Index('ix_txn_project_type_active', 'project_id', 'transaction_type', 'is_deleted'),
+        # Category statistics: count and per-type sums for one category
+        # Why INCLUDE on Postgres? amount and id ride in the index, so the
+        # aggregate can be answered by an index-only scan
+        db.Index(
+            'ix_txn_cat_type_active',
+            'category_id', 'transaction_type',
+            postgresql_include=['amount', 'id'],
+            postgresql_where=db.text('is_deleted = false')
+        ),
     )
     
     def __repr__(self):
@@ -193,6 +213,88 @@ class Transaction(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
+    @staticmethod
+    def to_dict_bulk(transactions):
+        """
+        Serialize many transactions for a JSON list response.
+        
+        Why a bulk helper?
+        - Calling to_dict() per row repeats the same global/attribute lookups
+        - float and isoformat are bound once, outside the loop
+        
+        Args:
+            transactions (iterable): Transaction objects
+        
+        Returns:
+            list: Dicts in the same shape as to_dict()
+        """
+        to_float = float
+        iso = date.isoformat
+        iso_dt = datetime.isoformat
+        
+        return [
+            {
+                'id': t.id,
+                'amount': to_float(t.amount),
+                'description': t.description,
+                'transaction_type': t.transaction_type,
+                'transaction_date': iso(t.transaction_date) if t.transaction_date else None,
+                'category_id': t.category_id,
+                'user_id': t.user_id,
+                'is_deleted': t.is_deleted,
+                'created_at': iso_dt(t.created_at) if t.created_at else None,
+                'updated_at': iso_dt(t.updated_at) if t.updated_at else None
+            }
+            for t in transactions
+        ]
+    
+    @classmethod
+    def list_for_user_core(cls, user_id, start_date, end_date):
+        """
+        List a user's active transactions as plain dicts, skipping the ORM.
+        
+        Why Core select()?
+        - Read-only JSON endpoints never modify the rows
+        - Row tuples skip identity map, instance state and attribute descriptors
+        - Edit/delete flows keep using ORM objects
+        
+        Args:
+            user_id (int): User ID
+            start_date (date): First date (inclusive)
+            end_date (date): Last date (inclusive)
+        
+        Returns:
+            list: Dicts with id, amount, transaction_type, transaction_date,
+                  category_id and description
+        """
+        result = db.session.execute(
+            select(
+                cls.id,
+                cls.amount,
+                cls.transaction_type,
+                cls.transaction_date,
+                cls.category_id,
+                cls.description
+            ).where(
+                cls.user_id == user_id,
+                cls.is_deleted == False,
+                cls.transaction_date >= start_date,
+                cls.transaction_date <= end_date
+            ).order_by(cls.transaction_date.desc(), cls.id.desc())
+        )
+        
+        return [
+            {
+                'id': row.id,
+                'amount': float(row.amount),
+                'transaction_type': row.transaction_type,
+                'transaction_date': row.transaction_date.isoformat(),
+                'category_id': row.category_id,
+                'description': row.description
+            }
+            for row in result
+        ]
+    
     def soft_delete(self):
         """
         Soft delete transaction (set is_deleted=True).
@@ -220,6 +322,74 @@ class Transaction(db.Model):
         self.is_deleted = False
         self.updated_at = datetime.utcnow()
     
+    @classmethod
+    def soft_delete_bulk(cls, ids, user_id):
+        """
+        Soft delete many transactions with a single UPDATE.
+        
+        Why bulk UPDATE?
+        - Calling soft_delete() per row costs one UPDATE per transaction
+        - One UPDATE ... WHERE id IN (...) covers the whole batch
+        - user_id filter keeps users from touching other users' rows
+        
+        Note: Objects already in the session are not refreshed, and the
+        caller commits once.
+        
+        Args:
+            ids (list): Transaction IDs
+            user_id (int): Owner of the transactions
+        
+        Returns:
+            int: Number of rows updated
+        
+        Example:
+            Transaction.soft_delete_bulk([1, 2, 3], current_user.id)
+            db.session.commit()
+        """
+        if not ids:
+            return 0
+        
+        return cls._soft_delete_where(cls.id.in_(ids), cls.user_id == user_id)
+    
+    @classmethod
+    def soft_delete_by_project(cls, project_id, user_id):
+        """
+        Soft delete every transaction in a project (caller commits).
+        
+        Args:
+            project_id (int): Project ID
+            user_id (int): Owner of the transactions
+        
+        Returns:
+            int: Number of rows updated
+        """
+        return cls._soft_delete_where(cls.project_id == project_id, cls.user_id == user_id)
+    
+    @classmethod
+    def soft_delete_by_category(cls, category_id, user_id):
+        """
+        Soft delete every transaction in a category (caller commits).
+        
+        Args:
+            category_id (int): Category ID
+            user_id (int): Owner of the transactions
+        
+        Returns:
+            int: Number of rows updated
+        """
+        return cls._soft_delete_where(cls.category_id == category_id, cls.user_id == user_id)
+    
+    @classmethod
+    def _soft_delete_where(cls, *criteria):
+        """Issue one UPDATE marking matching active transactions as deleted."""
+        return db.session.query(cls).filter(
+            *criteria,
+            cls.is_deleted == False
+        ).update(
+            {'is_deleted': True, 'updated_at': datetime.utcnow()},
+            synchronize_session=False
+        )
+    
     @staticmethod
     def get_balance(user_id, include_deleted=False):
         """
@@ -237,22 +407,47 @@ class Transaction(db.Model):
         Returns:
             Decimal: Current balance
         """
-        query = Transaction.query.filter_by(user_id=user_id)
+        # Why CASE? Income adds, expense subtracts - one scalar from the database
+        signed_amount = case(
+            (Transaction.transaction_type == 'income', Transaction.amount),
+            else_=-Transaction.amount
+        )
+        query = db.session.query(
+            func.coalesce(func.sum(signed_amount), Decimal('0.00'))
+        ).filter(Transaction.user_id == user_id)
         
         if not include_deleted:
-            query = query.filter_by(is_deleted=False)
+            query = query.filter(Transaction.is_deleted == False)
+        
+        return query.scalar()
+    
+    @classmethod
+    def _sum_by_type(cls, *criteria, include_deleted=False):
+        """
+        Sum income and expense amounts in a single query.
         
-        transactions = query.all()
+        Why CASE in SQL?
+        - Both totals come back in one row, no GROUP BY or Python branching
+        - No ORM objects built and no Python-side Decimal loop
         
-        balance = Decimal('0.00')
+        Args:
+            *criteria: Extra filter expressions
+            include_deleted (bool): Include soft-deleted transactions
+        
+        Returns:
+            dict: {'income': Decimal, 'expense': Decimal}
+        """
+        zero = Decimal('0.00')
+        query = db.session.query(
+            func.coalesce(func.sum(case((cls.transaction_type == 'income', cls.amount), else_=zero)), zero),
+            func.coalesce(func.sum(case((cls.transaction_type == 'expense', cls.amount), else_=zero)), zero)
+        ).filter(*criteria)
         
-        for transaction in transactions:
-            if transaction.transaction_type == 'income':
-                balance += transaction.amount
-            else:  # expense
-                balance -= transaction.amount
+        if not include_deleted:
+            query = query.filter(cls.is_deleted == False)
         
-        return balance
+        income, expense = query.one()
+        return {'income': income, 'expense': expense}
     
     @classmethod
     def get_monthly_summary(cls, user_id, year, month):
@@ -267,26 +462,20 @@ class Transaction(db.Model):
         Returns:
             dict: {'income': Decimal, 'expense': Decimal, 'balance': Decimal}
         """
-        from sqlalchemy import extract
+        # Why a date range instead of extract()?
+        # - Functions on transaction_date stop the database using its index
+        # - [first of month, first of next month) is a plain index range scan
+        first = date(year, month, 1)
+        next_first = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
         
-        transactions = cls.query.filter(
+        totals = cls._sum_by_type(
             cls.user_id == user_id,
-            cls.is_deleted == False,
-            extract('year', cls.transaction_date) == year,
-            extract('month', cls.transaction_date) == month
-        ).all()
-        
-        income = Decimal('0.00')
-        expense = Decimal('0.00')
-        
-        for transaction in transactions:
-            if transaction.transaction_type == 'income':
-                income += transaction.amount
-            else:
-                expense += transaction.amount
+            cls.transaction_date >= first,
+            cls.transaction_date < next_first
+        )
         
         return {
-            'income': income,
-            'expense': expense,
-            'balance': income - expense
+            'income': totals['income'],
+            'expense': totals['expense'],
+            'balance': totals['income'] - totals['expense']
         }
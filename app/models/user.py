@@ -8,11 +8,91 @@ Why this design?
 - Relationships defined here - SQLAlchemy handles foreign keys automatically
 """
 
+import binascii
+import hashlib
+import time
 from datetime import datetime
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event, inspect, or_
+from sqlalchemy.orm import make_transient_to_detached
 from app import db
 from flask_login import UserMixin
 
 
+# Marks hashes created from a SHA-256 pre-hashed password (see set_password)
+PREHASH_PREFIX = 'sha256$'
+
+
+def _prehash(password):
+    """
+    Reduce any password to a fixed 64-byte hex digest before bcrypt.
+    
+    Why?
+    - bcrypt silently ignores everything after 72 bytes
+    - Very long password bodies can't inflate hashing work
+    - Hex output never contains the NUL bytes bcrypt mishandles
+    """
+    return binascii.hexlify(hashlib.sha256(password.encode('utf-8')).digest())
+
+
+_bcrypt = None
+
+
+def _get_bcrypt():
+    """
+    Return the Flask-Bcrypt extension, importing it only once.
+    
+    Why not import at module top?
+    - app/__init__.py imports models while it is still being set up
+    - Binding on first use avoids the cycle and the per-call import
+    """
+    global _bcrypt
+    if _bcrypt is None:
+        from app import bcrypt
+        _bcrypt = bcrypt
+    return _bcrypt
+
+
+# Process-local user cache: user_id -> (expires_at, detached User snapshot)
+# Why? The user_loader runs on every authenticated request; within the TTL
+# the User row is rebuilt from memory instead of a primary-key SELECT
+_user_cache = {}
+_USER_CACHE_MAX = 1024
+
+
+def init_dummy_hash(app):
+    """
+    Build the bcrypt hash checked when a login email doesn't exist.
+    
+    Why at startup?
+    - Building it on the first unknown-email login makes that request pay
+      for an extra hash, which is the timing difference it hides
+    - Stored per app, so each app uses its own BCRYPT_LOG_ROUNDS
+    
+    Used by create_app, after config is loaded:
+        init_dummy_hash(app)
+    
+    Args:
+        app (Flask): Application to build the hash for
+    
+    Returns:
+        bytes: The dummy hash
+    """
+    dummy_hash = _get_bcrypt().generate_password_hash(
+        _prehash('dummy-password'), app.config['BCRYPT_LOG_ROUNDS']
+    )
+    app.extensions['login_dummy_hash'] = dummy_hash
+    return dummy_hash
+
+
+def _get_dummy_hash():
+    """Current app's dummy hash (built now if create_app didn't call init_dummy_hash)."""
+    dummy_hash = current_app.extensions.get('login_dummy_hash')
+    if dummy_hash is None:
+        dummy_hash = init_dummy_hash(current_app._get_current_object())
+    return dummy_hash
+
+
 class User(db.Model, UserMixin):
     """
     User model for authentication and user data.
@@ -43,10 +123,11 @@ class User(db.Model, UserMixin):
     
     email = db.Column(
         db.String(120), 
-        unique=True, 
-        nullable=False,
-        index=True  # Index for fast email lookups
+        nullable=False
     )
+    # Why no unique=True/index=True here?
+    # - Uniqueness is enforced case-insensitively by ux_users_email_lower (below the class)
+    # - Lookups filter on lower(email), which a plain email index can't serve
     
     password_hash = db.Column(
         db.String(255), 
@@ -64,12 +145,16 @@ class User(db.Model, UserMixin):
     
     # Relationships (defined as strings - SQLAlchemy resolves them later)
     # Why strings? Models may not be defined yet, SQLAlchemy resolves at runtime
+    # Why lazy='select' instead of 'dynamic'?
+    # - Dynamic builds a fresh query object on every access and can't be eager-loaded
+    # - Pages that iterate can batch with selectinload(User.categories)
+    # - Filtered lookups go through the services (e.g. CategoryService.get_user_categories)
     
     # One user has many categories
     categories = db.relationship(
         'Category',
         backref='user',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     
@@ -77,7 +162,7 @@ class User(db.Model, UserMixin):
     transactions = db.relationship(
         'Transaction',
         backref='user',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     
@@ -85,7 +170,7 @@ class User(db.Model, UserMixin):
     budget_goals = db.relationship(
         'BudgetGoal',
         backref='user',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     
@@ -93,7 +178,7 @@ class User(db.Model, UserMixin):
     projects = db.relationship(
         'Project',
         backref='user',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     # Why projects relationship?
@@ -138,6 +223,150 @@ class User(db.Model, UserMixin):
         """
         return f'<User {self.username}>'
     
+    @classmethod
+    def get_for_request(cls, user_id):
+        """
+        Load a user once per request (used by the Flask-Login user_loader).
+        
+        Why cache on flask.g?
+        - Flask-Login can call the user_loader several times per request
+        - g lives for exactly one request, so the cache can never go stale
+        - Repeat calls cost a dict lookup instead of a primary-key SELECT
+        - Session.get() checks the identity map first and skips building
+          a legacy Query object
+        
+        Example (in create_app):
+            @login_manager.user_loader
+            def load_user(user_id):
+                return User.get_for_request(user_id)
+        
+        Args:
+            user_id (str): User ID stored in the session
+        
+        Returns:
+            User or None if not found (always None for static files)
+        """
+        # Why skip static? Static files never need current_user,
+        # so logged-in users shouldn't pay a SELECT per asset
+        if has_request_context() and request.endpoint == 'static':
+            return None
+        
+        cache = g.setdefault('_loaded_users', {})
+        if user_id not in cache:
+            cache[user_id] = cls._load_cached(int(user_id))
+        return cache[user_id]
+    
+    @classmethod
+    def _load_cached(cls, user_id):
+        """
+        Load a user, reusing a snapshot from the process-local cache.
+        
+        Why merge(load=False)?
+        - Attaches the cached snapshot to this request's session without SQL
+        - current_user behaves like a normally loaded, persistent User
+        
+        Invalidation:
+        - Any UPDATE/DELETE of the user in this process drops the entry
+        - Other workers see changes after USER_CACHE_TTL seconds at most,
+          including deactivation, lockouts and password changes
+        - USER_CACHE_TTL = 0 (the default) disables the cache; only opt in
+          on single-worker deployments or with a short TTL
+        
+        Args:
+            user_id (int): User ID
+        
+        Returns:
+            User or None if not found
+        """
+        ttl = current_app.config.get('USER_CACHE_TTL', 0)
+        if not ttl:
+            return db.session.get(cls, user_id)
+        
+        now = time.monotonic()
+        entry = _user_cache.get(user_id)
+        if entry is not None and entry[0] > now:
+            return db.session.merge(entry[1], load=False)
+        
+        user = db.session.get(cls, user_id)
+        if user is not None:
+            if len(_user_cache) >= _USER_CACHE_MAX:
+                _user_cache.clear()
+            _user_cache[user_id] = (now + ttl, user._snapshot())
+        return user
+    
+    def _snapshot(self):
+        """Detached copy of this user's column values (no relationships)."""
+        snapshot = User(**{
+            attr.key: getattr(self, attr.key)
+            for attr in inspect(User).column_attrs
+        })
+        make_transient_to_detached(snapshot)
+        return snapshot
+    
+    @classmethod
+    def authenticate(cls, email, password):
+        """
+        Look up a user by email and verify the password.
+        
+        Why not check "user exists" first?
+        - Skipping bcrypt for unknown emails makes them answer faster
+        - That timing difference reveals which emails have accounts
+        - Unknown emails run one bcrypt check against a dummy hash instead
+        
+        Args:
+            email (str): Email address from the login form
+            password (str): Plain text password
+        
+        Returns:
+            User or None if the email is unknown or the password is wrong
+        
+        Example:
+            user = User.authenticate(form.email.data, form.password.data)
+            if user:
+                login_user(user)
+        """
+        user = cls.query.filter(db.func.lower(cls.email) == email.lower()).first()
+        
+        if user is None:
+            _get_bcrypt().check_password_hash(_get_dummy_hash(), _prehash(password))
+            return None
+        
+        return user if user.check_password(password) else None
+    
+    @classmethod
+    def get_taken_fields(cls, username, email):
+        """
+        Check username and email uniqueness in a single query.
+        
+        Why one query?
+        - Signup validates both fields on every POST
+        - Separate username/email lookups cost two round-trips
+        - Only the two columns are selected (no ORM objects built)
+        
+        Args:
+            username (str): Requested username
+            email (str): Requested email
+        
+        Returns:
+            set: Subset of {'username', 'email'} already in use
+        
+        Example:
+            taken = User.get_taken_fields(form.username.data, form.email.data)
+            if 'email' in taken:
+                form.email.errors.append('Email already registered.')
+        """
+        rows = cls.query.filter(
+            or_(cls.username == username, db.func.lower(cls.email) == email.lower())
+        ).with_entities(cls.username, cls.email).all()
+        
+        taken = set()
+        for row in rows:
+            if row.username == username:
+                taken.add('username')
+            if row.email.lower() == email.lower():
+                taken.add('email')
+        return taken
+    
     def set_password(self, password):
         """
         Hash and set user password.
@@ -147,12 +376,21 @@ class User(db.Model, UserMixin):
         - Encapsulates bcrypt logic
         - Easy to change hashing algorithm later
         
+        Why pass rounds explicitly?
+        - Hash time doubles with every round (signup/login latency)
+        - Each environment picks its cost via BCRYPT_LOG_ROUNDS
+          (4 in tests, 10 by default, raise in production if CPU allows)
+        
         Args:
             password (str): Plain text password
         """
-        from app import bcrypt
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        bcrypt = _get_bcrypt()
+        rounds = current_app.config['BCRYPT_LOG_ROUNDS']
+        self.password_hash = PREHASH_PREFIX + bcrypt.generate_password_hash(
+            _prehash(password), rounds
+        ).decode('utf-8')
         # Why decode('utf-8')? Bcrypt returns bytes, we need string for database
+        # Why the prefix? Tells check_password which scheme produced the hash
     
     def check_password(self, password):
         """
@@ -167,9 +405,22 @@ class User(db.Model, UserMixin):
         Why separate method?
         - Encapsulates bcrypt verification logic
         - Constant-time comparison (security - prevents timing attacks)
+        
+        Legacy hashes (bcrypt of the raw password, no prefix) still verify.
+        On success they are re-hashed with the pre-hash scheme; the caller's
+        next commit (e.g. updating last_login) persists the upgrade.
         """
-        from app import bcrypt
-        return bcrypt.check_password_hash(self.password_hash, password)
+        bcrypt = _get_bcrypt()
+        if self.password_hash.startswith(PREHASH_PREFIX):
+            return bcrypt.check_password_hash(
+                self.password_hash[len(PREHASH_PREFIX):], _prehash(password)
+            )
+        
+        if not bcrypt.check_password_hash(self.password_hash, password):
+            return False
+        
+        self.set_password(password)  # Upgrade legacy hash
+        return True
     
     def to_dict(self):
         """
@@ -187,7 +438,37 @@ class User(db.Model, UserMixin):
             'id': self.id,
             'username': self.username,
             'email': self.email,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at_iso
             # Why isoformat()? Standard ISO 8601 format for dates in JSON
             # Note: password_hash is NOT included (security)
         }
+    
+    @property
+    def created_at_iso(self):
+        """
+        created_at as an ISO 8601 string, formatted once per loaded instance.
+        
+        Why cache?
+        - created_at never changes after insert
+        - to_dict() runs on cached users, so the same string is rebuilt often
+        
+        Returns:
+            str: ISO 8601 timestamp, or None before the user is flushed
+        """
+        value = self.__dict__.get('_created_at_iso')
+        if value is None and self.created_at is not None:
+            value = self.__dict__['_created_at_iso'] = self.created_at.isoformat()
+        return value
+
+
+# Case-insensitive unique email
+# Why functional? The database enforces uniqueness whatever case was stored,
+# and lower(email) lookups become an index seek
+db.Index('ux_users_email_lower', db.func.lower(User.email), unique=True)
+
+
+# Drop cached snapshots as soon as this process changes the user
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_user_cache(mapper, connection, target):
+    _user_cache.pop(target.id, None)
@@ -6,11 +6,50 @@ Why separate routes into blueprints?
 - Scalability: Easy to add new features without cluttering a single file
 - URL Prefixes: Group related routes under a common prefix
 - Modularity: Blueprints can be registered/unregistered easily
+
+Why lazy imports?
+- Importing a blueprint module pulls in its forms, services and models
+- CLI commands (flask db ...) and tests that never hit a route skip that cost
+- Blueprints are only imported when create_app registers them
 """
 
-# Import blueprints
-from app.routes.auth import auth_bp
+import importlib
+
+# Blueprint name -> module that defines it
+# Why a mapping instead of imports? Nothing is imported until requested.
+BLUEPRINTS = {
+    'auth_bp': 'app.routes.auth',
+    'budgets_bp': 'app.routes.budgets',
+    'projects_bp': 'app.routes.projects',
+    'recurring_bp': 'app.routes.recurring',
+}
+
+__all__ = list(BLUEPRINTS)
+
+
+def __getattr__(name):
+    """
+    Resolve blueprints on first access (PEP 562).
+
+    Example:
+        from app.routes import auth_bp  # imports app.routes.auth only
+    """
+    module_path = BLUEPRINTS.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    blueprint = getattr(importlib.import_module(module_path), name)
+    globals()[name] = blueprint  # Cache so __getattr__ isn't hit again
+    return blueprint
+
+
+def iter_blueprints():
+    """
+    Import and yield every registered blueprint.
 
-# Future blueprints (Module 5+)
-# from app.routes.dashboard import dashboard_bp
-# from app.routes.transactions import transactions_bp
+    Used by create_app:
+        for blueprint in iter_blueprints():
+            app.register_blueprint(blueprint)
+    """
+    for name in BLUEPRINTS:
+        yield globals().get(name) or __getattr__(name)
@@ -13,8 +13,8 @@ from app import db
 from app.forms.budget import BudgetGoalForm
 from app.services.budget_service import BudgetService
 from app.services.category_service import CategoryService
+from app.services.dashboard_service import DashboardService
 from app.utils.audit import audit_log
-from decimal import Decimal
 
 # Create blueprint
 budgets_bp = Blueprint(
@@ -39,11 +39,8 @@ def index():
     Returns:
         Rendered budget list template
     """
-    # Get all budget statuses
-    budget_statuses = BudgetService.get_all_budget_statuses(current_user.id)
-    
-    # Get budgets needing alerts
-    alert_budgets = BudgetService.get_budgets_needing_alerts(current_user.id)
+    # Statuses and alerts from one load (spending batched per period window)
+    budget_statuses, alert_budgets = DashboardService.get_all_budget_statuses(current_user.id)
     
     return render_template(
         'budgets/index.html',
@@ -69,30 +66,32 @@ def create():
     form = BudgetGoalForm()
     
     # Populate category choices with all categories
-    all_categories = CategoryService.get_user_categories(current_user.id)
-    form.category_id.choices = [(c.id, c.name) for c in all_categories]
+    category_choices = CategoryService.get_user_category_choices(current_user.id)
+    form.category_id.choices = category_choices
     
-    if not all_categories:
+    if not category_choices:
         flash('Please create at least one category first.', 'warning')
         return redirect(url_for('budgets.index'))
     
     if form.validate_on_submit():
+        # Why look the name up here?
+        # - The choices are already loaded, so the flash message needs no
+        #   refresh() SELECT after the commit
+        category_name = dict(category_choices)[form.category_id.data]
+        
         try:
             # Create budget goal using service
             budget_goal = BudgetService.create_budget_goal(
                 user_id=current_user.id,
                 category_id=form.category_id.data,
-                amount=Decimal(str(form.amount.data)),
+                amount=form.amount.data,
                 period=form.period.data,
                 alert_threshold=form.alert_threshold.data
             )
             
             # Set active status
+            # Why no commit here? It goes out with the audit entry below
             budget_goal.is_active = form.is_active.data
-            db.session.commit()
-            
-            # Refresh to load relationships
-            db.session.refresh(budget_goal)
             
             # Audit log
             audit_log('CREATE', 'BudgetGoal', budget_goal.id, new_value={
@@ -102,7 +101,7 @@ def create():
             })
             db.session.commit()
             
-            flash(f'Budget goal for {budget_goal.category.name} created successfully!', 'success')
+            flash(f'Budget goal for {category_name} created successfully!', 'success')
             return redirect(url_for('budgets.index'))
             
         except ValueError as e:
@@ -110,7 +109,7 @@ def create():
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while creating the budget goal.', 'danger')
-            current_app.logger.error(f'Budget creation failed: {e}', exc_info=True)
+            current_app.logger.exception('Budget creation failed: %s', e)
     
     return render_template(
         'budgets/create.html',
@@ -152,7 +151,7 @@ def edit(budget_id):
             BudgetService.update_budget_goal(
                 budget_id=budget_id,
                 user_id=current_user.id,
-                amount=Decimal(str(form.amount.data)),
+                amount=form.amount.data,
                 period=form.period.data,
                 alert_threshold=form.alert_threshold.data,
                 is_active=form.is_active.data
@@ -173,10 +172,10 @@ def edit(budget_id):
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while updating the budget goal.', 'danger')
-            current_app.logger.error(f'Budget update failed: {e}', exc_info=True)
+            current_app.logger.exception('Budget update failed: %s', e)
     elif request.method == 'POST':
         # Form validation failed
-        current_app.logger.warning(f'Budget form validation errors: {form.errors}')
+        current_app.logger.warning('Budget form validation errors: %s', form.errors)
         for field, errors in form.errors.items():
             for error in errors:
                 flash(f'{field}: {error}', 'danger')
@@ -224,7 +223,7 @@ def delete(budget_id):
     except Exception as e:
         db.session.rollback()
         flash('An error occurred while deleting the budget goal.', 'danger')
-        current_app.logger.error(f'Budget deletion failed: {e}', exc_info=True)
+        current_app.logger.exception('Budget deletion failed: %s', e)
     
     return redirect(url_for('budgets.index'))
 
@@ -255,6 +254,6 @@ def toggle_active(budget_id):
     except Exception as e:
         db.session.rollback()
         flash('An error occurred while toggling the budget goal.', 'danger')
-        current_app.logger.error(f'Budget toggle failed: {e}', exc_info=True)
+        current_app.logger.exception('Budget toggle failed: %s', e)
     
     return redirect(url_for('budgets.index'))
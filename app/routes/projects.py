@@ -44,7 +44,7 @@ def create():
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while creating the project.', 'danger')
-            current_app.logger.error(f'Project creation failed: {e}', exc_info=True)
+            current_app.logger.exception('Project creation failed: %s', e)
     
     return render_template('projects/create.html', form=form, title='New Project')
 
@@ -80,7 +80,7 @@ def edit(project_id):
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while updating the project.', 'danger')
-            current_app.logger.error(f'Project update failed: {e}', exc_info=True)
+            current_app.logger.exception('Project update failed: %s', e)
     
     if request.method == 'GET':
         form.name.data = project.name
@@ -105,7 +105,7 @@ def delete(project_id):
     except Exception as e:
         db.session.rollback()
         flash('An error occurred while deleting the project.', 'danger')
-        current_app.logger.error(f'Project deletion failed: {e}', exc_info=True)
+        current_app.logger.exception('Project deletion failed: %s', e)
     
     return redirect(url_for('projects.index'))
 
@@ -9,8 +9,8 @@ from app.models.recurring_transaction import RecurringTransaction
 from app.models.transaction import Transaction
 from app.forms.recurring_transaction import RecurringTransactionForm
 from app.services.category_service import CategoryService
+from app.services.project_service import ProjectService
 from app.utils.audit import audit_log
-from decimal import Decimal
 import bleach
 
 recurring_bp = Blueprint('recurring', __name__, url_prefix='/recurring')
@@ -37,12 +37,9 @@ def create():
     """Create a new recurring transaction."""
     form = RecurringTransactionForm()
     
-    categories = CategoryService.get_user_categories(current_user.id)
-    form.category_id.choices = [(c.id, c.name) for c in categories]
+    form.category_id.choices = CategoryService.get_user_category_choices(current_user.id)
     
-    from app.services.project_service import ProjectService
-    projects = ProjectService.get_user_projects(current_user.id)
-    form.project_id.choices = [('', 'No Project')] + [(p.id, p.name) for p in projects]
+    form.project_id.choices = [('', 'No Project')] + ProjectService.get_user_project_choices(current_user.id)
     
     if form.validate_on_submit():
         try:
@@ -50,7 +47,7 @@ def create():
             
             recurring = RecurringTransaction(
                 user_id=current_user.id,
-                amount=Decimal(str(form.amount.data)),
+                amount=form.amount.data,
                 transaction_type=form.transaction_type.data,
                 category_id=form.category_id.data,
                 project_id=form.project_id.data if form.project_id.data else None,
@@ -78,7 +75,7 @@ def create():
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while creating the recurring transaction.', 'danger')
-            current_app.logger.error(f'Recurring transaction creation failed: {e}', exc_info=True)
+            current_app.logger.exception('Recurring transaction creation failed: %s', e)
     
     return render_template(
         'recurring/create.html',
@@ -101,18 +98,15 @@ def edit(recurring_id):
     
     form = RecurringTransactionForm()
     
-    categories = CategoryService.get_user_categories(current_user.id)
-    form.category_id.choices = [(c.id, c.name) for c in categories]
+    form.category_id.choices = CategoryService.get_user_category_choices(current_user.id)
     
-    from app.services.project_service import ProjectService
-    projects = ProjectService.get_user_projects(current_user.id)
-    form.project_id.choices = [('', 'No Project')] + [(p.id, p.name) for p in projects]
+    form.project_id.choices = [('', 'No Project')] + ProjectService.get_user_project_choices(current_user.id)
     
     if form.validate_on_submit():
         try:
             description = bleach.clean(form.description.data or '', tags=[], strip=True)
             
-            recurring.amount = Decimal(str(form.amount.data))
+            recurring.amount = form.amount.data
             recurring.transaction_type = form.transaction_type.data
             recurring.category_id = form.category_id.data
             recurring.project_id = form.project_id.data if form.project_id.data else None
@@ -133,7 +127,7 @@ def edit(recurring_id):
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while updating the recurring transaction.', 'danger')
-            current_app.logger.error(f'Recurring transaction update failed: {e}', exc_info=True)
+            current_app.logger.exception('Recurring transaction update failed: %s', e)
     
     if request.method == 'GET':
         form.amount.data = recurring.amount
@@ -173,7 +167,7 @@ def delete(recurring_id):
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while deleting the recurring transaction.', 'danger')
-            current_app.logger.error(f'Recurring transaction deletion failed: {e}', exc_info=True)
+            current_app.logger.exception('Recurring transaction deletion failed: %s', e)
     
     return redirect(url_for('recurring.index'))
 
@@ -231,7 +225,7 @@ def process_due():
             created_count += 1
             
         except Exception as e:
-            current_app.logger.error(f'Failed to process recurring transaction {item.id}: {e}')
+            current_app.logger.error('Failed to process recurring transaction %s: %s', item.id, e)
     
     db.session.commit()
     
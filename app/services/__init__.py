@@ -7,11 +7,38 @@ Why Service Layer?
 - Testability: Easy to unit test business logic
 - Maintainability: Easier to modify logic without touching routes
 - Framework Independence: Can switch frameworks without rewriting business logic
+
+Why lazy imports?
+- Importing any service module (e.g. app.services.category_service) runs
+  this file first; eager imports here loaded every service and model
+- Worker boot and CLI commands only pay for the services they use
+- Services are imported the first time they're accessed from this package
+
+Example:
+    from app.services import CategoryService  # imports category_service only
 """
 
-# Import services
-from app.services.category_service import CategoryService
-from app.services.transaction_service import TransactionService
-from app.services.budget_service import BudgetService
-from app.services.project_service import ProjectService
-from app.services.email_service import EmailService
+import importlib
+
+# Service name -> module that defines it
+_LAZY = {
+    'CategoryService': 'app.services.category_service',
+    'TransactionService': 'app.services.transaction_service',
+    'BudgetService': 'app.services.budget_service',
+    'ProjectService': 'app.services.project_service',
+    'EmailService': 'app.services.email_service',
+    'DashboardService': 'app.services.dashboard_service',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve services on first access (PEP 562)."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    service = getattr(importlib.import_module(module_path), name)
+    globals()[name] = service  # Cache so __getattr__ isn't hit again
+    return service
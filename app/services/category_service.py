@@ -14,8 +14,12 @@ Design Pattern: Service Layer Pattern
 - Models handle data persistence only
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from flask import g
+from sqlalchemy import Float, case, cast, func, update
+from sqlalchemy.exc import IntegrityError
 from app import db
+from app.models.budget_goal import BudgetGoal
 from app.models.category import Category
 from app.models.transaction import Transaction
 
@@ -41,6 +45,88 @@ class CategoryService:
         """
         return Category.query.filter_by(user_id=user_id).order_by(Category.name).all()
     
+    @staticmethod
+    def get_user_categories_page(
+        user_id: int,
+        limit: int,
+        offset: int = 0
+    ) -> Tuple[List[Category], int]:
+        """
+        Get one page of a user's categories and the total number of categories.
+        
+        Why COUNT(*) OVER ()?
+        - Same reason as ProjectService.get_user_projects_page: the total
+          comes back on every page row instead of from a second query
+        
+        Args:
+            user_id: User ID
+            limit: Page size
+            offset: Number of categories to skip
+        
+        Returns:
+            Tuple of (Category objects ordered by name, total category count)
+        """
+        rows = db.session.query(
+            Category,
+            func.count().over()
+        ).filter(
+            Category.user_id == user_id
+        ).order_by(Category.name).limit(limit).offset(offset).all()
+        
+        if not rows:
+            # Past the last page the window has no rows to report on
+            total = Category.query.filter_by(user_id=user_id).count() if offset else 0
+            return [], total
+        
+        return [category for category, _ in rows], rows[0][1]
+    
+    @staticmethod
+    def get_user_category_choices(user_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (id, name) choices for category SelectFields.
+        
+        Why cache on flask.g?
+        - Create/edit pages populate choices on GET and again on POST
+        - Several forms on one page need the same list
+        - g is per-request, so changes show up on the next request
+        
+        Why select only id and name?
+        - Choices never need the other columns
+        - Rows come back as plain tuples, no Category objects to build and track
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of (category_id, name) tuples ordered by name
+        """
+        cache = g.setdefault('_category_choices', {})
+        if user_id not in cache:
+            cache[user_id] = [
+                tuple(row) for row in CategoryService.get_user_categories_light(user_id)
+            ]
+        return cache[user_id]
+    
+    @staticmethod
+    def get_user_categories_light(user_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (id, name) rows for all user categories.
+        
+        Why not get_user_categories()?
+        - Dropdowns and lists of names never touch the other columns
+        - Plain rows skip building Category objects and identity-map tracking
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of (id, name) rows ordered by name
+        """
+        return db.session.query(
+            Category.id,
+            Category.name
+        ).filter_by(user_id=user_id).order_by(Category.name).all()
+    
     @staticmethod
     def get_category_by_id(category_id: int, user_id: int) -> Optional[Category]:
         """
@@ -56,8 +142,14 @@ class CategoryService:
         
         Returns:
             Category object or None if not found or not owned by user
+        
+        Why session.get()?
+        - Identity-map lookup first; no SELECT if already loaded this request
         """
-        return Category.query.filter_by(id=category_id, user_id=user_id).first()
+        category = db.session.get(Category, category_id)
+        if category is None or category.user_id != user_id:
+            return None
+        return category
     
     @staticmethod
     def create_category(name: str, user_id: int, is_default: bool = False) -> Category:
@@ -79,11 +171,6 @@ class CategoryService:
         Raises:
             ValueError: If category name already exists for user
         """
-        # Check if category already exists
-        existing = Category.query.filter_by(user_id=user_id, name=name).first()
-        if existing:
-            raise ValueError(f'Category "{name}" already exists')
-        
         # Create category
         category = Category(
             name=name,
@@ -91,8 +178,16 @@ class CategoryService:
             is_default=is_default
         )
         
+        # Why no duplicate check first?
+        # - The (user_id, name) unique constraint rejects duplicates atomically
+        # - Saves a SELECT per create and can't race a concurrent request
         db.session.add(category)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError(f'Category "{name}" already exists')
+        g.pop('_category_choices', None)
         
         return category
     
@@ -113,29 +208,35 @@ class CategoryService:
         Returns:
             Updated Category object
         
+        Why one conditional UPDATE?
+        - Ownership and the default check are part of the WHERE clause, so
+          nothing can change between checking and writing
+        - RETURNING hands back the updated row in the same round trip
+        - uq_user_category_name rejects duplicate names (no SELECT first)
+        
         Raises:
             ValueError: If category not found, not owned, is default, or name exists
         """
-        category = CategoryService.get_category_by_id(category_id, user_id)
+        try:
+            category = db.session.execute(
+                update(Category).where(
+                    Category.id == category_id,
+                    Category.user_id == user_id,
+                    Category.is_default == False
+                ).values(name=name).returning(Category)
+            ).scalar_one_or_none()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError(f'Category "{name}" already exists')
         
-        if not category:
+        if category is None:
+            # Nothing matched; look once to report the right reason
+            if CategoryService.get_category_by_id(category_id, user_id):
+                raise ValueError('Cannot modify default categories')
             raise ValueError('Category not found')
         
-        if category.is_default:
-            raise ValueError('Cannot modify default categories')
-        
-        # Check if new name already exists (excluding current category)
-        existing = Category.query.filter(
-            Category.user_id == user_id,
-            Category.name == name,
-            Category.id != category_id
-        ).first()
-        
-        if existing:
-            raise ValueError(f'Category "{name}" already exists')
-        
-        category.name = name
         db.session.commit()
+        g.pop('_category_choices', None)
         
         return category
     
@@ -168,8 +269,13 @@ class CategoryService:
             raise ValueError('Cannot delete default categories')
         
         # Check if category has transactions
-        transaction_count = Transaction.query.filter_by(category_id=category_id).count()
-        if transaction_count > 0:
+        # Why EXISTS? It stops at the first matching row; the full count is
+        # only needed (and only run) for the error message
+        has_transactions = db.session.query(
+            Transaction.query.filter_by(category_id=category_id).exists()
+        ).scalar()
+        if has_transactions:
+            transaction_count = Transaction.query.filter_by(category_id=category_id).count()
             raise ValueError(
                 f'Cannot delete category with {transaction_count} transaction(s). '
                 'Please reassign or delete transactions first.'
@@ -177,9 +283,10 @@ class CategoryService:
         
         db.session.delete(category)
         db.session.commit()
+        g.pop('_category_choices', None)
     
     @staticmethod
-    def create_default_categories(user_id: int) -> List[Category]:
+    def create_default_categories(user_id: int, commit: bool = True) -> List[Category]:
         """
         Create default categories for a new user.
         
@@ -192,14 +299,31 @@ class CategoryService:
         - Income: Salary, Freelance, Investments
         - Expenses: Food, Rent, Transportation, Utilities, Entertainment, Healthcare, Shopping, Other
         
+        Why bulk insert?
+        - Adding categories one by one builds and tracks an object per row
+        - bulk_insert_mappings sends every row in a single executemany INSERT
+        - One commit, then one SELECT to hand back the created rows
+        
+        Why commit=False?
+        - Signup can flush the new user, add its categories and commit once
+        - User and categories are then saved (or rolled back) together
+        
         Args:
             user_id: User ID
+            commit: Commit the transaction (False leaves it to the caller)
         
         Returns:
             List of created Category objects
         """
-        # Use the model's class method
-        return Category.create_default_categories_for_user(user_id)
+        db.session.bulk_insert_mappings(Category, [
+            {'name': name, 'user_id': user_id, 'is_default': True}
+            for name in Category.get_default_categories()
+        ])
+        if commit:
+            db.session.commit()
+        g.pop('_category_choices', None)
+        
+        return Category.query.filter_by(user_id=user_id, is_default=True).all()
     
     @staticmethod
     def get_category_statistics(category_id: int, user_id: int) -> dict:
@@ -219,8 +343,8 @@ class CategoryService:
             Dictionary with category statistics:
             {
                 'transaction_count': int,
-                'total_spent': Decimal,
-                'total_earned': Decimal,
+                'total_spent': float,
+                'total_earned': float,
                 'has_budget_goal': bool
             }
         
@@ -232,39 +356,36 @@ class CategoryService:
         if not category:
             raise ValueError('Category not found')
         
-        # Get transaction statistics
-        from sqlalchemy import func
-        from app.models.budget_goal import BudgetGoal
-        
-        # Count transactions
-        transaction_count = Transaction.query.filter_by(
+        # Why one query?
+        # - Count, spent and earned come from a single pass over the
+        #   category's transactions using CASE sums
+        # - The budget goal check rides along as an uncorrelated EXISTS
+        budget_goal_exists = db.session.query(BudgetGoal.id).filter_by(
             category_id=category_id,
-            is_deleted=False
-        ).count()
-        
-        # Sum expenses
-        total_spent = db.session.query(func.sum(Transaction.amount)).filter(
-            Transaction.category_id == category_id,
-            Transaction.transaction_type == 'expense',
-            Transaction.is_deleted == False
-        ).scalar() or 0
-        
-        # Sum income
-        total_earned = db.session.query(func.sum(Transaction.amount)).filter(
+            is_active=True
+        ).exists()
+        
+        # Sums are cast to float in SQL: the dict is read-only display data,
+        # so no Decimal is built just to be converted again
+        transaction_count, total_spent, total_earned, has_budget_goal = db.session.query(
+            func.count(Transaction.id),
+            cast(func.coalesce(func.sum(case(
+                (Transaction.transaction_type == 'expense', Transaction.amount),
+                else_=0
+            )), 0), Float),
+            cast(func.coalesce(func.sum(case(
+                (Transaction.transaction_type == 'income', Transaction.amount),
+                else_=0
+            )), 0), Float),
+            budget_goal_exists
+        ).filter(
             Transaction.category_id == category_id,
-            Transaction.transaction_type == 'income',
             Transaction.is_deleted == False
-        ).scalar() or 0
-        
-        # Check if category has budget goal
-        has_budget_goal = BudgetGoal.query.filter_by(
-            category_id=category_id,
-            is_active=True
-        ).first() is not None
+        ).one()
         
         return {
             'transaction_count': transaction_count,
-            'total_spent': float(total_spent),
-            'total_earned': float(total_earned),
-            'has_budget_goal': has_budget_goal
+            'total_spent': total_spent,
+            'total_earned': total_earned,
+            'has_budget_goal': bool(has_budget_goal)
         }
@@ -0,0 +1,156 @@
+"""
+Dashboard Service - Everything the dashboard renders, in as few queries as possible.
+
+Why DashboardService?
+- The dashboard used to call five services one after another
+- Each call re-queried data another call had already loaded
+- Budget alerts were recomputed per goal with their own SUM queries
+
+Queries issued by build():
+- One GROUP BY for the period summary
+- One SELECT (with category joined) for recent transactions
+- One SELECT for budget goals plus one grouped SUM per period window
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from app.models.budget_goal import BudgetGoal
+from app.services.transaction_service import TransactionService
+
+
+class DashboardService:
+    """Service class for dashboard data."""
+    
+    @staticmethod
+    def build(
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        recent_limit: int = 10
+    ) -> Dict:
+        """
+        Collect all dashboard data for a user.
+        
+        Args:
+            user_id: User ID
+            start_date: Summary start (defaults to first of current month)
+            end_date: Summary end (defaults to today)
+            recent_limit: Number of recent transactions to show
+        
+        Returns:
+            Dictionary with dashboard data:
+            {
+                'summary': dict (see TransactionService.get_spending_summary),
+                'recent_transactions': [Transaction, ...],
+                'budget_statuses': [dict, ...],
+                'alert_budgets': [BudgetGoal, ...]
+            }
+        """
+        summary = TransactionService.get_spending_summary(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        recent_transactions = TransactionService.get_user_transactions(
+            user_id=user_id,
+            limit=recent_limit
+        )
+        
+        # Spending is pre-filled on each goal, so the status/alert helpers
+        # below reuse it instead of querying per goal
+        budget_goals = BudgetGoal.get_dashboard(user_id)
+        
+        return {
+            'summary': summary,
+            'recent_transactions': recent_transactions,
+            'budget_statuses': [
+                DashboardService.budget_status(goal) for goal in budget_goals
+            ],
+            'alert_budgets': [goal for goal in budget_goals if goal.should_alert()]
+        }
+    
+    @staticmethod
+    def get_all_budget_statuses(user_id: int) -> Tuple[List[Dict], List[BudgetGoal]]:
+        """
+        Build the budget list page: a status for every goal plus the alerts.
+        
+        Why here instead of one status call per goal?
+        - Each status needs the goal's period spending (one SUM per goal)
+        - BudgetGoal.get_dashboard fills spending for all goals with at most
+          one grouped SUM per period window
+        - Alerts are picked from the same goals, so no second pass
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Tuple of (budget statuses, BudgetGoals needing an alert)
+        """
+        budget_goals = BudgetGoal.get_dashboard(user_id, include_inactive=True)
+        
+        statuses = [DashboardService.budget_status(goal) for goal in budget_goals]
+        alert_budgets = [goal for goal in budget_goals if goal.should_alert()]
+        
+        return statuses, alert_budgets
+    
+    @staticmethod
+    def get_budget_status_for_category(user_id: int, category_id: int) -> Optional[Dict]:
+        """
+        Get the status of the active budget for one category.
+        
+        Why?
+        - After saving an expense only that category's budget can change
+        - One goal lookup and one SUM, instead of statuses for every budget
+        
+        Args:
+            user_id: User ID
+            category_id: Category ID
+        
+        Returns:
+            Budget status dict, or None if the category has no active budget
+        """
+        budget_goal = BudgetGoal.query.filter_by(
+            user_id=user_id,
+            category_id=category_id,
+            is_active=True
+        ).first()
+        
+        if budget_goal is None:
+            return None
+        
+        return DashboardService.budget_status(budget_goal)
+    
+    @staticmethod
+    def budget_status(budget_goal: BudgetGoal) -> Dict:
+        """
+        Build the status dict the budget templates render.
+        
+        Args:
+            budget_goal: BudgetGoal (ideally from BudgetGoal.get_dashboard)
+        
+        Why derive everything from one spending figure?
+        - Remaining, percentage and over-budget are plain arithmetic on it
+        - No helper re-reads spending or re-converts the amount
+        
+        Returns:
+            Dictionary with budget status
+        """
+        spending = budget_goal.get_current_period_spending()
+        budget_amount = budget_goal.amount_float
+        current_spending = float(spending)
+        percentage_used = round(current_spending / budget_amount * 100, 2)
+        
+        return {
+            'budget_id': budget_goal.id,
+            'category_id': budget_goal.category_id,
+            'category_name': budget_goal.category.name,
+            'period': budget_goal.period,
+            'is_active': budget_goal.is_active,
+            'budget_amount': budget_amount,
+            'current_spending': current_spending,
+            'remaining': float(budget_goal.amount - spending),
+            'percentage_used': percentage_used,
+            'is_over_budget': spending > budget_goal.amount,
+            'should_alert': budget_goal.is_active and percentage_used >= budget_goal.alert_threshold
+        }
@@ -8,47 +8,204 @@ Why EmailService?
 - Professional HTML email templates
 """
 
-from flask import render_template, current_app
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
 from flask_mail import Message
 from app import mail
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
 
+# Guards the per-app failure counter updated from pool threads
+_failure_lock = threading.Lock()
+
+
+def _get_executor(app) -> ThreadPoolExecutor:
+    """
+    Return the app's mail pool, creating it on first background send.
+    
+    Why a pool per app instead of a thread per email?
+    - Threads are reused, and a burst of alerts can't spawn unbounded threads
+    - Four concurrent SMTP connections is plenty for this app's volume
+    - Kept in app.extensions so apps (e.g. in tests) never share one, and
+      shut down at exit after queued messages are delivered
+    """
+    executor = app.extensions.get('mail_executor')
+    if executor is None:
+        executor = app.extensions['mail_executor'] = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='mail'
+        )
+        atexit.register(executor.shutdown, wait=True)
+    return executor
+
+
+def _render(template_name: str, **context) -> str:
+    """
+    Render an email template from a per-app cache of compiled templates.
+    
+    Why not render_template()?
+    - It resolves the template through the loader and runs every context
+      processor on each call; email templates only use what they're passed
+    - Compiled templates are kept on the app, so each is looked up once
+    
+    Args:
+        template_name: Template path, e.g. 'emails/welcome.html'
+        **context: Template variables
+    
+    Returns:
+        str: Rendered template
+    """
+    templates = current_app.extensions.setdefault('email_templates', {})
+    template = templates.get(template_name)
+    if template is None:
+        template = templates[template_name] = current_app.jinja_env.get_template(template_name)
+    return template.render(**context)
+
+
+def _deliver(messages: List[Message]) -> None:
+    """
+    Send messages over a single SMTP connection.
+    
+    Why one connection?
+    - mail.send() connects, starts TLS and logs in for every message
+    - A batch (e.g. weekly summaries) pays that handshake once
+    """
+    with mail.connect() as conn:
+        for msg in messages:
+            conn.send(msg)
+
+
+def _send_async(app, messages: List[Message]) -> None:
+    """
+    Deliver messages from the mail pool (see EmailService.send_bulk).
+    
+    The caller already returned, so failures are logged and counted in
+    app.extensions['mail_failed_count'] (see EmailService.get_failed_count).
+    """
+    with app.app_context():
+        try:
+            _deliver(messages)
+        except Exception as e:
+            with _failure_lock:
+                app.extensions['mail_failed_count'] = (
+                    app.extensions.get('mail_failed_count', 0) + len(messages)
+                )
+            app.logger.error(
+                'Failed to send %d email(s) in the background: %s', len(messages), e
+            )
+
+
 class EmailService:
     """Service class for email operations."""
     
     @staticmethod
-    def send_email(subject: str, recipients: List[str], text_body: str, html_body: str) -> bool:
+    def send_email(
+        subject: str,
+        recipients: List[str],
+        text_body: str,
+        html_body: str,
+        background: Optional[bool] = None
+    ) -> bool:
         """
         Send an email.
         
+        Why background?
+        - SMTP round trips take hundreds of milliseconds or more
+        - No route should hold up its response waiting on the mail server
+        - Templates are rendered by the caller; only delivery moves to the pool
+        - A queued message can't report an SMTP failure back to the caller;
+          callers that need to know pass background=False
+        
         Args:
             subject: Email subject
             recipients: List of recipient email addresses
             text_body: Plain text email body
             html_body: HTML email body
+            background: Deliver from the mail pool and return immediately
+                (default: MAIL_SEND_ASYNC config)
+        
+        Returns:
+            bool: True if sent successfully, False otherwise. In the
+            background, True only means the message was queued; delivery
+            failures are logged and counted (see get_failed_count).
+        """
+        msg = EmailService.build_message(subject, recipients, text_body, html_body)
+        return EmailService.send_bulk([msg], background=background)
+    
+    @staticmethod
+    def build_message(subject: str, recipients: List[str], text_body: str, html_body: str) -> Message:
+        """
+        Build a message without sending it (see send_bulk).
+        
+        Args:
+            subject: Email subject
+            recipients: List of recipient email addresses
+            text_body: Plain text email body
+            html_body: HTML email body
+        
+        Returns:
+            Message: Ready-to-send message
+        """
+        msg = Message(
+            subject=subject,
+            recipients=recipients,
+            sender=current_app.config['MAIL_DEFAULT_SENDER']
+        )
+        msg.body = text_body
+        msg.html = html_body
+        return msg
+    
+    @staticmethod
+    def send_bulk(messages: List[Message], background: Optional[bool] = None) -> bool:
+        """
+        Send several messages over one SMTP connection.
+        
+        Args:
+            messages: Messages from build_message()
+            background: Deliver from the mail pool and return immediately
+                (default: MAIL_SEND_ASYNC config)
         
         Returns:
-            bool: True if sent successfully, False otherwise
+            bool: True if sent successfully, False otherwise. In the
+            background, True only means the messages were queued; delivery
+            failures are logged and counted (see get_failed_count).
+        
+        Example:
+            messages = [EmailService.build_weekly_summary(email, data) for email, data in batch]
+            EmailService.send_bulk(messages)
         """
+        if not messages:
+            return True
+        
+        if background is None:
+            background = current_app.config.get('MAIL_SEND_ASYNC', False)
+        
         try:
-            msg = Message(
-                subject=subject,
-                recipients=recipients,
-                sender=current_app.config['MAIL_DEFAULT_SENDER']
-            )
-            msg.body = text_body
-            msg.html = html_body
+            if background:
+                app = current_app._get_current_object()
+                _get_executor(app).submit(_send_async, app, messages)
+                return True
             
-            mail.send(msg)
+            _deliver(messages)
             return True
         except Exception as e:
-            current_app.logger.error(f'Failed to send email: {e}')
+            current_app.logger.error('Failed to send email: %s', e)
             return False
     
     @staticmethod
-    def send_budget_alert(user_email: str, budget_data: Dict) -> bool:
+    def get_failed_count() -> int:
+        """
+        Number of background messages this app failed to deliver.
+        
+        Returns:
+            int: Failed message count since the app started
+        """
+        return current_app.extensions.get('mail_failed_count', 0)
+    
+    @staticmethod
+    def send_budget_alert(user_email: str, budget_data: Dict, background: Optional[bool] = None) -> bool:
         """
         Send budget alert notification.
         
@@ -60,18 +217,20 @@ class EmailService:
                 - current_spending: float
                 - percentage_used: float
                 - period: str
+            background: Deliver without blocking the request
+                (default: MAIL_SEND_ASYNC config)
         
         Returns:
-            bool: True if sent successfully
+            bool: True if sent successfully (only queued, when in the background)
         """
         subject = f"Budget Alert: {budget_data['category_name']}"
         
-        text_body = render_template(
+        text_body = _render(
             'emails/budget_alert.txt',
             budget=budget_data
         )
         
-        html_body = render_template(
+        html_body = _render(
             'emails/budget_alert.html',
             budget=budget_data
         )
@@ -80,29 +239,32 @@ class EmailService:
             subject=subject,
             recipients=[user_email],
             text_body=text_body,
-            html_body=html_body
+            html_body=html_body,
+            background=background
         )
     
     @staticmethod
-    def send_budget_exceeded_alert(user_email: str, budget_data: Dict) -> bool:
+    def send_budget_exceeded_alert(user_email: str, budget_data: Dict, background: Optional[bool] = None) -> bool:
         """
         Send budget exceeded notification.
         
         Args:
             user_email: User's email address
             budget_data: Dictionary containing budget information
+            background: Deliver without blocking the request
+                (default: MAIL_SEND_ASYNC config)
         
         Returns:
-            bool: True if sent successfully
+            bool: True if sent successfully (only queued, when in the background)
         """
         subject = f"⚠️ Budget Exceeded: {budget_data['category_name']}"
         
-        text_body = render_template(
+        text_body = _render(
             'emails/budget_exceeded.txt',
             budget=budget_data
         )
         
-        html_body = render_template(
+        html_body = _render(
             'emails/budget_exceeded.html',
             budget=budget_data
         )
@@ -111,14 +273,38 @@ class EmailService:
             subject=subject,
             recipients=[user_email],
             text_body=text_body,
-            html_body=html_body
+            html_body=html_body,
+            background=background
         )
     
     @staticmethod
-    def send_weekly_summary(user_email: str, summary_data: Dict) -> bool:
+    def send_weekly_summary(user_email: str, summary_data: Dict, background: Optional[bool] = None) -> bool:
         """
         Send weekly spending summary.
         
+        For many users at once, build each message with
+        build_weekly_summary() and pass them all to send_bulk().
+        
+        Args:
+            user_email: User's email address
+            summary_data: Dictionary containing summary information
+                (see build_weekly_summary)
+            background: Deliver without blocking the request
+                (default: MAIL_SEND_ASYNC config)
+        
+        Returns:
+            bool: True if sent successfully (only queued, when in the background)
+        """
+        return EmailService.send_bulk(
+            [EmailService.build_weekly_summary(user_email, summary_data)],
+            background=background
+        )
+    
+    @staticmethod
+    def build_weekly_summary(user_email: str, summary_data: Dict) -> Message:
+        """
+        Build (but don't send) a weekly spending summary.
+        
         Args:
             user_email: User's email address
             summary_data: Dictionary containing summary information
@@ -131,21 +317,21 @@ class EmailService:
                 - budget_statuses: List[Dict]
         
         Returns:
-            bool: True if sent successfully
+            Message: Weekly summary message
         """
         subject = f"Weekly Summary: {summary_data['week_start']} - {summary_data['week_end']}"
         
-        text_body = render_template(
+        text_body = _render(
             'emails/weekly_summary.txt',
             summary=summary_data
         )
         
-        html_body = render_template(
+        html_body = _render(
             'emails/weekly_summary.html',
             summary=summary_data
         )
         
-        return EmailService.send_email(
+        return EmailService.build_message(
             subject=subject,
             recipients=[user_email],
             text_body=text_body,
@@ -153,25 +339,27 @@ class EmailService:
         )
     
     @staticmethod
-    def send_welcome_email(user_email: str, username: str) -> bool:
+    def send_welcome_email(user_email: str, username: str, background: Optional[bool] = None) -> bool:
         """
         Send welcome email to new users.
         
         Args:
             user_email: User's email address
             username: User's username
+            background: Deliver without blocking the request
+                (default: MAIL_SEND_ASYNC config)
         
         Returns:
-            bool: True if sent successfully
+            bool: True if sent successfully (only queued, when in the background)
         """
         subject = "Welcome to SwiftBudget!"
         
-        text_body = render_template(
+        text_body = _render(
             'emails/welcome.txt',
             username=username
         )
         
-        html_body = render_template(
+        html_body = _render(
             'emails/welcome.html',
             username=username
         )
@@ -180,5 +368,6 @@ class EmailService:
             subject=subject,
             recipients=[user_email],
             text_body=text_body,
-            html_body=html_body
+            html_body=html_body,
+            background=background
         )
@@ -8,7 +8,11 @@ Why ProjectService?
 - Manages project lifecycle
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+from decimal import Decimal
+from flask import g
+from sqlalchemy import case, func, update
+from sqlalchemy.exc import IntegrityError
 from app import db
 from app.models.project import Project
 from app.models.transaction import Transaction
@@ -48,15 +52,6 @@ class ProjectService:
         if len(name) > 100:
             raise ValueError('Project name must be 100 characters or less')
         
-        # Check for duplicate project name
-        existing = Project.query.filter_by(
-            user_id=user_id,
-            name=name
-        ).first()
-        
-        if existing:
-            raise ValueError(f'Project "{name}" already exists')
-        
         # Validate color (basic hex validation)
         if color and not color.startswith('#'):
             color = f'#{color}'
@@ -69,15 +64,24 @@ class ProjectService:
             color=color
         )
         
+        # Duplicate names are rejected by uq_user_project_name in the same
+        # round trip as the INSERT (no SELECT first, no race between requests)
         db.session.add(project)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError(f'Project "{name}" already exists')
+        g.pop('_project_choices', None)
         
         return project
     
     @staticmethod
     def get_user_projects(
         user_id: int,
-        active_only: bool = True
+        active_only: bool = True,
+        limit: Optional[int] = None,
+        after_name: Optional[str] = None
     ) -> List[Project]:
         """
         Get all projects for a user.
@@ -85,12 +89,134 @@ class ProjectService:
         Args:
             user_id: User ID
             active_only: Only return active projects (default: True)
+            limit: Maximum number of projects (optional, default all)
+            after_name: Keyset cursor - name of the last project already shown
         
         Returns:
-            List of Project objects
+            List of Project objects ordered by name
         """
         query = Project.query.filter_by(user_id=user_id)
         
+        if active_only:
+            query = query.filter_by(is_active=True)
+        
+        if after_name is not None:
+            query = query.filter(Project.name > after_name)
+        
+        query = query.order_by(Project.name)
+        
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
+    
+    @staticmethod
+    def get_user_projects_page(
+        user_id: int,
+        limit: int,
+        offset: int = 0,
+        active_only: bool = False
+    ) -> Tuple[List[Project], int]:
+        """
+        Get one page of a user's projects and the total number of projects.
+        
+        Why COUNT(*) OVER ()?
+        - A page plus a separate COUNT runs the same filtered query twice
+        - The window function attaches the full count to every page row,
+          so one query returns both
+        
+        Args:
+            user_id: User ID
+            limit: Page size
+            offset: Number of projects to skip
+            active_only: Only count and return active projects
+        
+        Returns:
+            Tuple of (Project objects ordered by name, total project count)
+        """
+        query = db.session.query(
+            Project,
+            func.count().over()
+        ).filter(Project.user_id == user_id)
+        
+        if active_only:
+            query = query.filter(Project.is_active == True)
+        
+        rows = query.order_by(Project.name).limit(limit).offset(offset).all()
+        
+        if not rows:
+            # Past the last page the window has no rows to report on
+            total = ProjectService.count_user_projects(user_id, active_only) if offset else 0
+            return [], total
+        
+        return [project for project, _ in rows], rows[0][1]
+    
+    @staticmethod
+    def count_user_projects(user_id: int, active_only: bool = False) -> int:
+        """
+        Count a user's projects.
+        
+        Args:
+            user_id: User ID
+            active_only: Only count active projects
+        
+        Returns:
+            int: Number of projects
+        """
+        query = db.session.query(func.count(Project.id)).filter(Project.user_id == user_id)
+        
+        if active_only:
+            query = query.filter(Project.is_active == True)
+        
+        return query.scalar()
+    
+    @staticmethod
+    def get_user_project_choices(user_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (id, name) choices of active projects for SelectFields.
+        
+        Cached on flask.g for the rest of the request and selected as an
+        (id, name) projection (see CategoryService.get_user_category_choices).
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of (project_id, name) tuples ordered by name
+        """
+        cache = g.setdefault('_project_choices', {})
+        if user_id not in cache:
+            cache[user_id] = [
+                (project_id, name)
+                for project_id, name, _ in ProjectService.get_user_projects_light(user_id)
+            ]
+        return cache[user_id]
+    
+    @staticmethod
+    def get_user_projects_light(
+        user_id: int,
+        active_only: bool = True
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Get (id, name, color) rows for user projects.
+        
+        Why not get_user_projects()?
+        - Dropdowns and badges only need the name and color
+        - Plain rows skip building Project objects and identity-map tracking
+        
+        Args:
+            user_id: User ID
+            active_only: Only return active projects (default: True)
+        
+        Returns:
+            List of (id, name, color) rows ordered by name
+        """
+        query = db.session.query(
+            Project.id,
+            Project.name,
+            Project.color
+        ).filter_by(user_id=user_id)
+        
         if active_only:
             query = query.filter_by(is_active=True)
         
@@ -107,11 +233,16 @@ class ProjectService:
         
         Returns:
             Project object or None
+        
+        Why session.get()?
+        - Checks the identity map first, so a project already loaded in this
+          request (e.g. by a toggle followed by a redirect) costs no SELECT
+        - Ownership is checked in Python on the loaded row
         """
-        return Project.query.filter_by(
-            id=project_id,
-            user_id=user_id
-        ).first()
+        project = db.session.get(Project, project_id)
+        if project is None or project.user_id != user_id:
+            return None
+        return project
     
     @staticmethod
     def update_project(
@@ -136,13 +267,15 @@ class ProjectService:
         Returns:
             Updated Project object
         
+        Why one conditional UPDATE?
+        - Ownership is part of the WHERE clause; RETURNING hands back the
+          updated project, so there's no SELECT before the write
+        - uq_user_project_name rejects duplicate names atomically
+        
         Raises:
             ValueError: If project not found or validation fails
         """
-        project = ProjectService.get_project_by_id(project_id, user_id)
-        
-        if not project:
-            raise ValueError('Project not found')
+        values = {}
         
         # Update name if provided
         if name is not None:
@@ -154,31 +287,42 @@ class ProjectService:
             if len(name) > 100:
                 raise ValueError('Project name must be 100 characters or less')
             
-            # Check for duplicate name (excluding current project)
-            existing = Project.query.filter(
-                Project.user_id == user_id,
-                Project.name == name,
-                Project.id != project_id
-            ).first()
-            
-            if existing:
-                raise ValueError(f'Project "{name}" already exists')
-            
-            project.name = name
+            values['name'] = name
         
         # Update other fields
         if description is not None:
-            project.description = description
+            values['description'] = description
         
         if color is not None:
             if color and not color.startswith('#'):
                 color = f'#{color}'
-            project.color = color
+            values['color'] = color
         
         if is_active is not None:
-            project.is_active = is_active
+            values['is_active'] = is_active
+        
+        if not values:
+            project = ProjectService.get_project_by_id(project_id, user_id)
+            if not project:
+                raise ValueError('Project not found')
+            return project
+        
+        try:
+            project = db.session.execute(
+                update(Project).where(
+                    Project.id == project_id,
+                    Project.user_id == user_id
+                ).values(**values).returning(Project)
+            ).scalar_one_or_none()
+        except IntegrityError:
+            db.session.rollback()
+            raise ValueError(f'Project "{name}" already exists')
+        
+        if not project:
+            raise ValueError('Project not found')
         
         db.session.commit()
+        g.pop('_project_choices', None)
         
         return project
     
@@ -189,6 +333,16 @@ class ProjectService:
         
         Note: Transactions linked to this project will have project_id set to NULL.
         
+        Why bulk DELETE/UPDATE instead of session.delete()?
+        - session.delete() loads the project and every linked transaction
+          just to null out project_id row by row
+        - The ownership check is part of the DELETE's WHERE clause, and
+          rowcount tells us whether anything matched
+        - One UPDATE unlinks the transactions (SQLite doesn't enforce
+          ON DELETE SET NULL unless foreign keys are switched on)
+        - synchronize_session='fetch' drops an already loaded Project from
+          the session, so it doesn't still look persistent after commit
+        
         Args:
             project_id: Project ID
             user_id: User ID (for ownership verification)
@@ -196,13 +350,20 @@ class ProjectService:
         Raises:
             ValueError: If project not found
         """
-        project = ProjectService.get_project_by_id(project_id, user_id)
+        deleted = Project.query.filter_by(
+            id=project_id,
+            user_id=user_id
+        ).delete(synchronize_session='fetch')
         
-        if not project:
+        if not deleted:
             raise ValueError('Project not found')
         
-        db.session.delete(project)
+        Transaction.query.filter_by(project_id=project_id).update(
+            {'project_id': None},
+            synchronize_session=False
+        )
         db.session.commit()
+        g.pop('_project_choices', None)
     
     @staticmethod
     def toggle_project_active(project_id: int, user_id: int) -> Project:
@@ -213,19 +374,32 @@ class ProjectService:
             project_id: Project ID
             user_id: User ID (for ownership verification)
         
+        Why UPDATE ... RETURNING?
+        - The flip happens in SQL (is_active = NOT is_active), so there is
+          no SELECT before the write
+        - RETURNING hands back the updated project in the same round trip;
+          no row means not found or not owned
+        
         Returns:
             Updated Project object
         
         Raises:
             ValueError: If project not found
         """
-        project = ProjectService.get_project_by_id(project_id, user_id)
+        project = db.session.execute(
+            update(Project).where(
+                Project.id == project_id,
+                Project.user_id == user_id
+            ).values(
+                is_active=~Project.is_active
+            ).returning(Project)
+        ).scalar_one_or_none()
         
         if not project:
             raise ValueError('Project not found')
         
-        project.is_active = not project.is_active
         db.session.commit()
+        g.pop('_project_choices', None)
         
         return project
     
@@ -263,19 +437,78 @@ class ProjectService:
         }
     
     @staticmethod
-    def get_all_project_statistics(user_id: int) -> List[Dict]:
+    def get_all_project_statistics(
+        user_id: int,
+        limit: Optional[int] = None,
+        after_name: Optional[str] = None
+    ) -> List[Dict]:
         """
         Get statistics for all user projects.
         
+        Why one grouped query?
+        - get_project_statistics() per project costs a lookup and an
+          aggregate each (1 + 2P queries)
+        - A LEFT JOIN + GROUP BY returns every project with its income,
+          expense and count sums in a single round trip
+        
+        Why keyset pagination on name?
+        - Names are unique per user (uq_user_project_name) and already the
+          sort order, so "name > last name seen" is a stable cursor
+        - Each page costs the same, however many projects come before it
+        
         Args:
             user_id: User ID
+            limit: Maximum number of projects (optional, default all)
+            after_name: Cursor - project_name of the last row already shown
         
         Returns:
-            List of project statistics
+            List of project statistics (same shape as get_project_statistics)
         """
-        projects = ProjectService.get_user_projects(user_id, active_only=False)
+        income = func.sum(case(
+            (Transaction.transaction_type == 'income', Transaction.amount),
+            else_=Decimal('0')
+        ))
+        expenses = func.sum(case(
+            (Transaction.transaction_type == 'expense', Transaction.amount),
+            else_=Decimal('0')
+        ))
+        
+        query = db.session.query(
+            Project.id,
+            Project.name,
+            Project.is_active,
+            Project.created_at,
+            income,
+            expenses,
+            func.count(Transaction.id)
+        ).outerjoin(
+            Transaction,
+            db.and_(
+                Transaction.project_id == Project.id,
+                Transaction.is_deleted == False
+            )
+        ).filter(
+            Project.user_id == user_id
+        )
+        
+        if after_name is not None:
+            query = query.filter(Project.name > after_name)
+        
+        query = query.group_by(Project.id).order_by(Project.name)
+        
+        if limit:
+            query = query.limit(limit)
         
         return [
-            ProjectService.get_project_statistics(project.id, user_id)
-            for project in projects
+            {
+                'project_id': project_id,
+                'project_name': name,
+                'is_active': is_active,
+                'total_income': float(total_income or 0),
+                'total_expenses': float(total_expenses or 0),
+                'net_spending': float((total_expenses or 0) - (total_income or 0)),
+                'transaction_count': transaction_count,
+                'created_at': created_at.isoformat() if created_at else None
+            }
+            for project_id, name, is_active, created_at, total_income, total_expenses, transaction_count in query
         ]
@@ -19,6 +19,14 @@ from sqlalchemy.orm import joinedload
 from app import db
 from app.models.transaction import Transaction
 from app.models.category import Category
+from app.services.project_service import ProjectService
+
+
+# Default for update arguments where None is a real value (clears the field)
+_UNSET = object()
+
+# Why frozenset? Built once at import; membership is a hash lookup
+_VALID_TRANSACTION_TYPES = frozenset({'income', 'expense'})
 
 
 class TransactionService:
@@ -31,7 +39,10 @@ class TransactionService:
         category_id: int,
         transaction_type: str,
         transaction_date: date,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        quantity: Optional[Decimal] = None,
+        unit_price: Optional[Decimal] = None,
+        project_id: Optional[int] = None
     ) -> Transaction:
         """
         Create a new transaction.
@@ -39,6 +50,7 @@ class TransactionService:
         Validations:
         - Amount must be positive
         - Category must exist and belong to user
+        - Project (if given) must exist and belong to user
         - Transaction type must be 'income' or 'expense'
         
         Args:
@@ -48,6 +60,13 @@ class TransactionService:
             transaction_type: 'income' or 'expense'
             transaction_date: Date of transaction
             description: Optional description
+            quantity: Optional item quantity
+            unit_price: Optional price per item
+            project_id: Optional project ID
+        
+        Why take quantity/unit_price/project_id here?
+        - Setting them after creation meant a second commit per form submit
+        - Everything is written in one INSERT and one commit
         
         Returns:
             Created Transaction object
@@ -60,7 +79,7 @@ class TransactionService:
             raise ValueError('Amount must be positive')
         
         # Validate transaction type
-        if transaction_type not in ['income', 'expense']:
+        if transaction_type not in _VALID_TRANSACTION_TYPES:
             raise ValueError('Transaction type must be "income" or "expense"')
         
         # Validate category ownership
@@ -68,6 +87,10 @@ class TransactionService:
         if not category:
             raise ValueError('Category not found or does not belong to user')
         
+        # Validate project ownership (project totals only filter on project_id)
+        if project_id is not None and not ProjectService.get_project_by_id(project_id, user_id):
+            raise ValueError('Project not found or does not belong to user')
+        
         # Create transaction
         transaction = Transaction(
             user_id=user_id,
@@ -75,7 +98,10 @@ class TransactionService:
             category_id=category_id,
             transaction_type=transaction_type,
             transaction_date=transaction_date,
-            description=description
+            description=description,
+            quantity=quantity,
+            unit_price=unit_price,
+            project_id=project_id
         )
         
         db.session.add(transaction)
@@ -105,6 +131,40 @@ class TransactionService:
             is_deleted=False
         ).first()
     
+    @staticmethod
+    def get_transaction_form_data(transaction_id: int, user_id: int):
+        """
+        Get just the columns an edit form is pre-filled with.
+        
+        Why a projection?
+        - The GET branch of an edit page only copies values into the form
+        - Selecting those columns skips building a Transaction and can't
+          trigger relationship lazy loads; POST still loads the entity
+        
+        Args:
+            transaction_id: Transaction ID
+            user_id: User ID (for ownership verification)
+        
+        Returns:
+            Row with amount, quantity, unit_price, category_id,
+            transaction_type, transaction_date, description and project_id,
+            or None if not found
+        """
+        return db.session.query(
+            Transaction.amount,
+            Transaction.quantity,
+            Transaction.unit_price,
+            Transaction.category_id,
+            Transaction.transaction_type,
+            Transaction.transaction_date,
+            Transaction.description,
+            Transaction.project_id
+        ).filter_by(
+            id=transaction_id,
+            user_id=user_id,
+            is_deleted=False
+        ).first()
+    
     @staticmethod
     def get_user_transactions(
         user_id: int,
@@ -112,7 +172,9 @@ class TransactionService:
         transaction_type: Optional[str] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        before_date: Optional[date] = None,
+        before_id: Optional[int] = None
     ) -> List[Transaction]:
         """
         Get user transactions with optional filters.
@@ -130,6 +192,14 @@ class TransactionService:
             start_date: Filter from this date (optional)
             end_date: Filter to this date (optional)
             limit: Maximum number of transactions (optional)
+            before_date: Keyset cursor - date of the last row already shown
+            before_id: Keyset cursor - id of the last row already shown
+        
+        Why keyset pagination?
+        - OFFSET makes the database walk and discard every skipped row
+        - Rows strictly after the cursor in (transaction_date, id) DESC
+          order are found through the index, whatever page is requested
+        - Pass the last row's (transaction_date, id) to get the next page
         
         Returns:
             List of Transaction objects (newest first)
@@ -151,6 +221,15 @@ class TransactionService:
         if end_date:
             query = query.filter(Transaction.transaction_date <= end_date)
         
+        if before_date is not None and before_id is not None:
+            query = query.filter(or_(
+                Transaction.transaction_date < before_date,
+                and_(
+                    Transaction.transaction_date == before_date,
+                    Transaction.id < before_id
+                )
+            ))
+        
         # Order by date (newest first)
         query = query.order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
         
@@ -168,7 +247,10 @@ class TransactionService:
         category_id: Optional[int] = None,
         transaction_type: Optional[str] = None,
         transaction_date: Optional[date] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        quantity=_UNSET,
+        unit_price=_UNSET,
+        project_id=_UNSET
     ) -> Transaction:
         """
         Update a transaction.
@@ -186,6 +268,9 @@ class TransactionService:
             transaction_type: New type (optional)
             transaction_date: New date (optional)
             description: New description (optional)
+            quantity: New quantity (optional, None clears it)
+            unit_price: New unit price (optional, None clears it)
+            project_id: New project ID (optional, None removes the project)
         
         Returns:
             Updated Transaction object
@@ -212,7 +297,7 @@ class TransactionService:
             transaction.category_id = category_id
         
         if transaction_type is not None:
-            if transaction_type not in ['income', 'expense']:
+            if transaction_type not in _VALID_TRANSACTION_TYPES:
                 raise ValueError('Transaction type must be "income" or "expense"')
             transaction.transaction_type = transaction_type
         
@@ -222,6 +307,18 @@ class TransactionService:
         if description is not None:
             transaction.description = description
         
+        if quantity is not _UNSET:
+            transaction.quantity = quantity
+        
+        if unit_price is not _UNSET:
+            transaction.unit_price = unit_price
+        
+        if project_id is not _UNSET:
+            # Validate project ownership
+            if project_id is not None and not ProjectService.get_project_by_id(project_id, user_id):
+                raise ValueError('Project not found or does not belong to user')
+            transaction.project_id = project_id
+        
         db.session.commit()
         
         return transaction
@@ -243,6 +340,11 @@ class TransactionService:
         Soft delete is:
         - transaction.is_deleted = True
         
+        Why a single UPDATE?
+        - Loading the row first only to flip is_deleted costs a SELECT
+        - id, user_id and is_deleted=False in the WHERE clause do the
+          ownership and "not found" checks; rowcount says if one matched
+        
         Args:
             transaction_id: Transaction ID
             user_id: User ID (for ownership verification)
@@ -250,12 +352,11 @@ class TransactionService:
         Raises:
             ValueError: If transaction not found
         """
-        transaction = TransactionService.get_transaction_by_id(transaction_id, user_id)
+        deleted = Transaction.soft_delete_bulk([transaction_id], user_id)
         
-        if not transaction:
+        if not deleted:
             raise ValueError('Transaction not found')
         
-        transaction.soft_delete()
         db.session.commit()
     
     @staticmethod
@@ -293,41 +394,47 @@ class TransactionService:
         if not end_date:
             end_date = date.today()
         
-        # Get transactions for period
-        transactions = TransactionService.get_user_transactions(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        # Calculate totals
-        total_income = sum(
-            t.amount for t in transactions if t.transaction_type == 'income'
-        )
-        total_expenses = sum(
-            t.amount for t in transactions if t.transaction_type == 'expense'
-        )
+        # Why aggregate in SQL?
+        # - One GROUP BY returns a row per (category, type) instead of every transaction
+        # - No Transaction/Category objects built for the dashboard summary
+        rows = db.session.query(
+            Category.name,
+            Transaction.transaction_type,
+            func.sum(Transaction.amount),
+            func.count(Transaction.id)
+        ).join(
+            Category, Transaction.category_id == Category.id
+        ).filter(
+            Transaction.user_id == user_id,
+            Transaction.is_deleted == False,
+            Transaction.transaction_date >= start_date,
+            Transaction.transaction_date <= end_date
+        ).group_by(Category.name, Transaction.transaction_type).all()
+        
+        total_income = Decimal('0.00')
+        total_expenses = Decimal('0.00')
+        transaction_count = 0
         
         # Group by category
         by_category = {}
-        for t in transactions:
-            category_name = t.category.name
-            if category_name not in by_category:
-                by_category[category_name] = {
-                    'income': Decimal('0.00'),
-                    'expense': Decimal('0.00')
-                }
+        for category_name, transaction_type, amount, count in rows:
+            totals = by_category.setdefault(category_name, {
+                'income': Decimal('0.00'),
+                'expense': Decimal('0.00')
+            })
+            totals[transaction_type] += amount
+            transaction_count += count
             
-            if t.transaction_type == 'income':
-                by_category[category_name]['income'] += t.amount
+            if transaction_type == 'income':
+                total_income += amount
             else:
-                by_category[category_name]['expense'] += t.amount
+                total_expenses += amount
         
         return {
             'total_income': float(total_income),
             'total_expenses': float(total_expenses),
             'net_balance': float(total_income - total_expenses),
-            'transaction_count': len(transactions),
+            'transaction_count': transaction_count,
             'by_category': by_category,
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat()
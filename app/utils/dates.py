@@ -0,0 +1,31 @@
+"""
+Date helpers for SwiftBudget.
+
+Why a request-scoped today()?
+- Form defaults and validators each called date.today()
+- Pages that build many forms repeat the same clock lookup
+- Inside a request the date is read once and stored on flask.g
+"""
+
+from datetime import date
+
+from flask import g, has_request_context
+
+
+def today():
+    """
+    Return today's date, computed once per request.
+
+    Returns:
+        date: Today's date (falls back to date.today() outside a request)
+
+    Example:
+        transaction_date = DateField(default=today)
+    """
+    if not has_request_context():
+        return date.today()
+
+    value = g.get('_today')
+    if value is None:
+        value = g._today = date.today()
+    return value
@@ -46,17 +46,27 @@ class Config:
     # - Disabling it reduces memory overhead
     # - SQLAlchemy's own event system still works
     
+    SQLALCHEMY_ECHO = False  # Don't route every statement through the logger
+    SQLALCHEMY_RECORD_QUERIES = False  # Per-query timing capture is for debugging only
+    
     # Session Configuration
     PERMANENT_SESSION_LIFETIME = timedelta(hours=2)  # Sessions expire after 2 hours (security)
     
     # Bcrypt Configuration
     # Lower rounds for production free tier (512MB RAM limit)
     # Default is 12, using 10 for better performance on limited resources
-    BCRYPT_LOG_ROUNDS = 10
+    # Each extra round doubles hashing time - override per deployment via env
+    # Aim for roughly 250ms per hash on the production host
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 10))
     SESSION_COOKIE_HTTPONLY = True  # Prevents JavaScript access (XSS protection)
     SESSION_COOKIE_SAMESITE = 'Lax'  # CSRF protection
     SESSION_REFRESH_EACH_REQUEST = True  # Refresh session on activity
     
+    # Seconds a loaded user is reused by the user_loader before re-querying (0 disables)
+    # Off by default: the cached row includes is_active, locked_until and
+    # password_hash, and changes made by other workers only show up after the TTL
+    USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', 0))
+    
     # Email Configuration (Gmail SMTP)
     MAIL_SERVER = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
     MAIL_PORT = int(os.getenv('MAIL_PORT', 587))
@@ -75,6 +85,11 @@ class Config:
     
     # Email sender configuration
     MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER', os.getenv('MAIL_USERNAME'))
+    # Deliver from a background pool so requests never wait on SMTP
+    # send_* then return True once queued; failures are logged and counted
+    # (EmailService.get_failed_count). Callers that need the delivery result
+    # pass background=False
+    MAIL_SEND_ASYNC = os.getenv('MAIL_SEND_ASYNC', 'True').lower() == 'true'
     
     # Cloudinary Configuration (image CDN)
     CLOUDINARY_CLOUD_NAME = os.getenv('CLOUDINARY_CLOUD_NAME')
@@ -82,11 +97,17 @@ class Config:
     CLOUDINARY_API_SECRET = os.getenv('CLOUDINARY_API_SECRET')
     
     # Rate Limiting (Flask-Limiter)
-    RATELIMIT_STORAGE_URL = 'memory://'  # Use Redis in production for distributed systems
+    # Storage backend is chosen per environment; limiter.init_app(app) reads it
+    # RATELIMIT_DEFAULT only applies if Limiter(...) is built without default_limits=
+    RATELIMIT_STORAGE_URI = os.getenv('RATELIMIT_STORAGE_URI', 'memory://')  # e.g. redis://host:6379 in production
+    RATELIMIT_STORAGE_URL = RATELIMIT_STORAGE_URI  # Legacy name read by older Flask-Limiter releases
+    RATELIMIT_DEFAULT = '200 per day;50 per hour'
     
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'logs/swiftbudget.log')
+    LOG_BUFFER_CAPACITY = int(os.getenv('LOG_BUFFER_CAPACITY', 1024))  # Records held before writing
+    LOG_FLUSH_INTERVAL = int(os.getenv('LOG_FLUSH_INTERVAL', 30))  # Seconds between background flushes
 
 
 class DevelopmentConfig(Config):
@@ -104,6 +125,7 @@ class DevelopmentConfig(Config):
     
     # Database
     SQLALCHEMY_ECHO = True  # Log all SQL queries (helpful for debugging)
+    SQLALCHEMY_RECORD_QUERIES = True  # Inspect queries via get_recorded_queries()
     
     # Session
     SESSION_COOKIE_SECURE = False  # Allow HTTP in development (no HTTPS required)
@@ -133,12 +155,16 @@ class TestingConfig(Config):
     
     # Suppress email sending in tests
     MAIL_SUPPRESS_SEND = True
+    MAIL_SEND_ASYNC = False  # Keep sends synchronous so tests can assert on them
     
-    # Faster password hashing in tests (bcrypt cost factor 4 instead of 12)
+    # Faster password hashing in tests (bcrypt cost factor 4 instead of 10)
     BCRYPT_LOG_ROUNDS = 4
     
     # Disable rate limiting in tests (allows unlimited requests)
     RATELIMIT_ENABLED = False
+    
+    # Every test builds a fresh database, so never reuse cached users
+    USER_CACHE_TTL = 0
 
 
 class ProductionConfig(Config):
@@ -157,14 +183,26 @@ class ProductionConfig(Config):
     
     # Database Connection Pooling - Optimized for production
     # Using small pool size for better performance while managing connections
+    # Sizes can be raised via env on hosts with more connection headroom
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 5,  # 5 persistent connections
-        'max_overflow': 10,  # Allow 10 additional connections under load
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),  # 5 persistent connections
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),  # Allow 10 additional connections under load
         'pool_timeout': 30,  # Wait 30s for connection
         'pool_recycle': 1800,  # Recycle connections every 30 min
         'pool_pre_ping': True,  # Verify connection before use
+        'pool_use_lifo': True,  # Reuse the most recent connection; idle extras time out server-side
     }
     
+    # Optional server-side statement timeout (milliseconds)
+    # Why? Caps how long any one query (e.g. statistics over a huge category)
+    # can hold a worker and a pooled connection
+    # Why opt-in? Some poolers (PgBouncer in transaction mode) reject the
+    # startup 'options' parameter
+    if os.getenv('DB_STATEMENT_TIMEOUT_MS'):
+        SQLALCHEMY_ENGINE_OPTIONS['connect_args'] = {
+            'options': f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS'))}"
+        }
+    
     # Alternative for very limited connection tiers (e.g., Supabase free tier):
     # from sqlalchemy.pool import NullPool
     # SQLALCHEMY_ENGINE_OPTIONS = {
@@ -39,6 +39,11 @@ def get_engine_url():
 config.set_main_option('sqlalchemy.url', get_engine_url())
 target_db = current_app.extensions['migrate'].db
 
+# Register every model on db.metadata for autogenerate.
+# Why here? Migrations are the only consumer that needs all models up
+# front; create_app leaves model imports to the blueprints that use them.
+import app.models  # noqa: E402,F401
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
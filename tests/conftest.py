@@ -108,6 +108,29 @@ def test_user(app):
         return user
 
 
+@pytest.fixture
+def other_user(app):
+    """
+    Create a second user for ownership checks.
+    
+    Returns a user with:
+    - username: otheruser
+    - email: other@example.com
+    - password: password123 (hashed)
+    """
+    with app.app_context():
+        user = User(
+            username='otheruser',
+            email='other@example.com'
+        )
+        user.set_password('password123')
+        db.session.add(user)
+        db.session.commit()
+        
+        db.session.refresh(user)
+        return user
+
+
 @pytest.fixture
 def test_category(app, test_user):
     """
@@ -45,6 +45,19 @@ class TestTestingConfig:
     def test_csrf_disabled(self):
         """Testing should have CSRF disabled for easier form testing."""
         assert TestingConfig.WTF_CSRF_ENABLED is False
+    
+    def test_query_recording_disabled(self):
+        """Testing should not echo or record SQL queries."""
+        assert TestingConfig.SQLALCHEMY_ECHO is False
+        assert TestingConfig.SQLALCHEMY_RECORD_QUERIES is False
+    
+    def test_user_cache_disabled(self):
+        """Testing should not reuse users across test databases."""
+        assert TestingConfig.USER_CACHE_TTL == 0
+
+    def test_mail_sent_synchronously(self):
+        """Testing should send mail inline so tests can assert on it."""
+        assert TestingConfig.MAIL_SEND_ASYNC is False
 
 
 class TestProductionConfig:
@@ -68,3 +81,21 @@ class TestProductionConfig:
         assert 'pool_size' in opts
         assert 'pool_pre_ping' in opts
         assert opts['pool_pre_ping'] is True
+    
+    def test_connection_pool_reuses_recent_connections(self):
+        """Production pool should hand out the most recently used connection."""
+        opts = ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+        assert opts['pool_use_lifo'] is True
+    
+    def test_rate_limit_storage_configured(self):
+        """Rate limit storage should be selected through config."""
+        assert ProductionConfig.RATELIMIT_STORAGE_URI
+        assert ProductionConfig.RATELIMIT_STORAGE_URL == ProductionConfig.RATELIMIT_STORAGE_URI
+    
+    def test_user_cache_opt_in(self):
+        """Cross-request user caching should be off unless explicitly enabled."""
+        assert ProductionConfig.USER_CACHE_TTL == 0
+    
+    def test_mail_sent_in_background(self):
+        """Production should send mail without holding up the request."""
+        assert ProductionConfig.MAIL_SEND_ASYNC is True
@@ -0,0 +1,102 @@
+"""
+Unit tests for BudgetGoal model.
+
+Why test the model?
+- Spending drives percentages, alerts and over-budget checks
+- The per-instance spending cache must never serve stale totals
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from app import db
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.budget_goal import BudgetGoal
+
+
+def _add_expense(user, category, amount, transaction_date=None):
+    """Create and commit an expense."""
+    db.session.add(Transaction(
+        amount=Decimal(amount),
+        transaction_type='expense',
+        transaction_date=transaction_date or date.today(),
+        user_id=user.id,
+        category_id=category.id
+    ))
+    db.session.commit()
+
+
+class TestBudgetGoalSpending:
+    """Test suite for current period spending."""
+    
+    def test_spending_refreshed_after_commit(self, app, test_user, test_category):
+        """Test a transaction committed after the first read is included on the next one."""
+        with app.app_context():
+            goal = BudgetGoal(amount=Decimal('100.00'), period='monthly',
+                              user_id=test_user.id, category_id=test_category.id)
+            db.session.add(goal)
+            db.session.commit()
+            
+            _add_expense(test_user, test_category, '30.00')
+            assert goal.get_current_period_spending() == Decimal('30.00')
+            assert goal.should_alert() is False
+            
+            _add_expense(test_user, test_category, '60.00')
+            assert goal.get_current_period_spending() == Decimal('90.00')
+            assert goal.should_alert() is True
+
+
+class TestBudgetGoalDashboard:
+    """Test suite for BudgetGoal.get_dashboard."""
+    
+    def test_dashboard_spending_matches_per_goal_spending(self, app, test_user, test_category):
+        """Test batched spending equals each goal's own SUM across mixed periods."""
+        with app.app_context():
+            food = test_category
+            rent = Category(name='Rent', user_id=test_user.id)
+            travel = Category(name='Travel', user_id=test_user.id)
+            paused = Category(name='Paused', user_id=test_user.id)
+            db.session.add_all([rent, travel, paused])
+            db.session.commit()
+            
+            today = date.today()
+            goals = {
+                'weekly': BudgetGoal(amount=Decimal('50.00'), period='weekly',
+                                     user_id=test_user.id, category_id=food.id),
+                'monthly': BudgetGoal(amount=Decimal('500.00'), period='monthly',
+                                      user_id=test_user.id, category_id=rent.id),
+                'yearly': BudgetGoal(amount=Decimal('2000.00'), period='yearly',
+                                     user_id=test_user.id, category_id=travel.id),
+            }
+            inactive = BudgetGoal(amount=Decimal('10.00'), period='monthly', is_active=False,
+                                  user_id=test_user.id, category_id=paused.id)
+            db.session.add_all(list(goals.values()) + [inactive])
+            db.session.commit()
+            
+            for category in (food, rent, travel, paused):
+                _add_expense(test_user, category, '10.00', today)
+                _add_expense(test_user, category, '20.00', today - timedelta(days=40))
+                _add_expense(test_user, category, '40.00', today - timedelta(days=400))
+                # Neither income nor soft-deleted rows count as spending
+                db.session.add_all([
+                    Transaction(amount=Decimal('1000.00'), transaction_type='income',
+                                transaction_date=today, user_id=test_user.id, category_id=category.id),
+                    Transaction(amount=Decimal('1000.00'), transaction_type='expense', is_deleted=True,
+                                transaction_date=today, user_id=test_user.id, category_id=category.id),
+                ])
+                db.session.commit()
+            
+            dashboard = BudgetGoal.get_dashboard(test_user.id)
+            
+            assert {goal.period for goal in dashboard} == {'weekly', 'monthly', 'yearly'}
+            for goal in dashboard:
+                expected = goal.get_spending(*goal.get_period_window())
+                assert goal.get_current_period_spending() == expected
+            
+            assert goals['weekly'].get_current_period_spending() == Decimal('10.00')
+            assert goals['monthly'].get_current_period_spending() == Decimal('10.00')
+            assert goals['yearly'].get_current_period_spending() >= Decimal('10.00')
+            
+            everything = BudgetGoal.get_dashboard(test_user.id, include_inactive=True)
+            assert inactive in everything
+            assert inactive.get_current_period_spending() == Decimal('10.00')
@@ -65,6 +65,59 @@ class TestCategoryService:
             assert categories[0].name == 'Food'
             assert categories[1].name == 'Rent'
     
+    def test_get_user_categories_page(self, app):
+        """Test a category page comes back with the full count."""
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('password')
+            db.session.add(user)
+            db.session.commit()
+            
+            for name in ('Food', 'Rent', 'Travel'):
+                CategoryService.create_category(name, user.id)
+            
+            categories, total = CategoryService.get_user_categories_page(user.id, limit=2, offset=1)
+            
+            assert total == 3
+            assert [c.name for c in categories] == ['Rent', 'Travel']
+            
+            categories, total = CategoryService.get_user_categories_page(user.id, limit=2, offset=5)
+            
+            assert categories == []
+            assert total == 3
+    
+    def test_create_default_categories(self, app):
+        """Test default categories are bulk-created for a new user."""
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('password')
+            db.session.add(user)
+            db.session.commit()
+            
+            categories = CategoryService.create_default_categories(user.id)
+            
+            assert len(categories) == len(Category.get_default_categories())
+            for category in categories:
+                assert category.id is not None
+                assert category.is_default is True
+                assert category.user_id == user.id
+    
+    def test_create_default_categories_without_commit(self, app):
+        """Test default categories share the caller's transaction."""
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('password')
+            db.session.add(user)
+            db.session.flush()
+            
+            categories = CategoryService.create_default_categories(user.id, commit=False)
+            assert len(categories) == len(Category.get_default_categories())
+            
+            db.session.rollback()
+            
+            assert User.query.count() == 0
+            assert Category.query.count() == 0
+    
     def test_update_category(self, app):
         """Test updating category name."""
         with app.app_context():
@@ -79,6 +132,37 @@ class TestCategoryService:
             
             assert updated.name == 'Groceries'
     
+    def test_update_category_duplicate_name(self, app):
+        """Test renaming onto an existing category name raises error."""
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('password')
+            db.session.add(user)
+            db.session.commit()
+            
+            CategoryService.create_category('Food', user.id)
+            rent = CategoryService.create_category('Rent', user.id)
+            
+            with pytest.raises(ValueError, match='already exists'):
+                CategoryService.update_category(rent.id, user.id, 'Food')
+            
+            assert db.session.get(Category, rent.id).name == 'Rent'
+    
+    def test_update_category_not_owned(self, app):
+        """Test another user's category can't be updated."""
+        with app.app_context():
+            owner = User(username='owner', email='owner@example.com')
+            other = User(username='other', email='other@example.com')
+            for user in (owner, other):
+                user.set_password('password')
+            db.session.add_all([owner, other])
+            db.session.commit()
+            
+            category = CategoryService.create_category('Food', other.id)
+            
+            with pytest.raises(ValueError, match='Category not found'):
+                CategoryService.update_category(category.id, owner.id, 'Groceries')
+    
     def test_cannot_update_default_category(self, app):
         """Test cannot update default categories."""
         with app.app_context():
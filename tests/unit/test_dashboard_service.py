@@ -0,0 +1,67 @@
+"""
+Unit tests for DashboardService.
+
+Why test the dashboard service?
+- Budget statuses are built from batched spending (BudgetGoal.get_dashboard)
+- They must match what one status per freshly loaded goal would show
+"""
+
+from datetime import date
+from decimal import Decimal
+from app import db
+from app.models.category import Category
+from app.models.budget_goal import BudgetGoal
+from app.services.dashboard_service import DashboardService
+from app.services.transaction_service import TransactionService
+
+
+class TestDashboardService:
+    """Test suite for DashboardService."""
+    
+    def test_all_budget_statuses_match_single_statuses(self, app, test_user):
+        """Test batched statuses and alerts equal per-category statuses."""
+        with app.app_context():
+            food = Category(name='Food', user_id=test_user.id)
+            rent = Category(name='Rent', user_id=test_user.id)
+            db.session.add_all([food, rent])
+            db.session.commit()
+            
+            db.session.add_all([
+                BudgetGoal(amount=Decimal('100.00'), period='weekly', alert_threshold=80,
+                           user_id=test_user.id, category_id=food.id),
+                BudgetGoal(amount=Decimal('1000.00'), period='monthly', alert_threshold=80,
+                           user_id=test_user.id, category_id=rent.id),
+            ])
+            db.session.commit()
+            
+            TransactionService.create_transaction(test_user.id, Decimal('90.00'), food.id, 'expense', date.today())
+            TransactionService.create_transaction(test_user.id, Decimal('100.00'), rent.id, 'expense', date.today())
+            
+            statuses, alert_budgets = DashboardService.get_all_budget_statuses(test_user.id)
+            
+            by_category = {status['category_id']: status for status in statuses}
+            assert by_category[food.id] == DashboardService.get_budget_status_for_category(test_user.id, food.id)
+            assert by_category[rent.id] == DashboardService.get_budget_status_for_category(test_user.id, rent.id)
+            assert by_category[food.id]['percentage_used'] == 90.0
+            assert by_category[food.id]['should_alert'] is True
+            assert by_category[rent.id]['remaining'] == 900.0
+            assert [goal.category_id for goal in alert_budgets] == [food.id]
+    
+    def test_budget_status_after_new_transaction(self, app, test_user):
+        """Test a status read after saving an expense includes that expense."""
+        with app.app_context():
+            food = Category(name='Food', user_id=test_user.id)
+            db.session.add(food)
+            db.session.commit()
+            db.session.add(BudgetGoal(amount=Decimal('100.00'), period='monthly',
+                                      user_id=test_user.id, category_id=food.id))
+            db.session.commit()
+            
+            before = DashboardService.get_budget_status_for_category(test_user.id, food.id)
+            assert before['current_spending'] == 0.0
+            
+            TransactionService.create_transaction(test_user.id, Decimal('85.00'), food.id, 'expense', date.today())
+            
+            after = DashboardService.get_budget_status_for_category(test_user.id, food.id)
+            assert after['current_spending'] == 85.0
+            assert after['should_alert'] is True
@@ -0,0 +1,197 @@
+"""
+Unit tests for ProjectService.
+
+Why test services?
+- Business logic validation
+- Verify authorization checks
+- Aggregates must match what the old per-project queries returned
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from app import db
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.project import Project
+from app.services.project_service import ProjectService
+
+
+def _add_transaction(user, category, amount, transaction_type='expense', project=None, is_deleted=False):
+    """Create and commit a transaction."""
+    transaction = Transaction(
+        amount=Decimal(amount),
+        transaction_type=transaction_type,
+        transaction_date=date.today(),
+        user_id=user.id,
+        category_id=category.id,
+        project_id=project.id if project else None,
+        is_deleted=is_deleted
+    )
+    db.session.add(transaction)
+    db.session.commit()
+    return transaction
+
+
+class TestDeleteProject:
+    """Test suite for ProjectService.delete_project."""
+    
+    def test_delete_project_unlinks_transactions(self, app, test_user):
+        """Test deleting a project keeps its transactions but clears project_id."""
+        with app.app_context():
+            category = Category(name='Food', user_id=test_user.id)
+            project = Project(name='Trip', user_id=test_user.id)
+            db.session.add_all([category, project])
+            db.session.commit()
+            transaction = _add_transaction(test_user, category, '25.00', project=project)
+            
+            ProjectService.delete_project(project.id, test_user.id)
+            
+            assert project not in db.session
+            assert db.session.get(Project, project.id) is None
+            assert db.session.get(Transaction, transaction.id).project_id is None
+    
+    def test_delete_project_not_owned(self, app, test_user, other_user):
+        """Test another user's project can't be deleted."""
+        with app.app_context():
+            project = Project(name='Trip', user_id=other_user.id)
+            db.session.add(project)
+            db.session.commit()
+            
+            with pytest.raises(ValueError, match='Project not found'):
+                ProjectService.delete_project(project.id, test_user.id)
+            
+            assert db.session.get(Project, project.id) is not None
+
+
+class TestProjectStatistics:
+    """Test suite for the grouped project statistics query."""
+    
+    def test_all_statistics_match_per_project_statistics(self, app, test_user):
+        """Test the grouped query returns the same dicts as one call per project."""
+        with app.app_context():
+            category = Category(name='Food', user_id=test_user.id)
+            trip = Project(name='Trip', user_id=test_user.id)
+            house = Project(name='House', user_id=test_user.id)
+            empty = Project(name='Empty', user_id=test_user.id)
+            db.session.add_all([category, trip, house, empty])
+            db.session.commit()
+            
+            _add_transaction(test_user, category, '100.00', 'income', project=trip)
+            _add_transaction(test_user, category, '40.00', 'expense', project=trip)
+            _add_transaction(test_user, category, '15.50', 'expense', project=trip)
+            _add_transaction(test_user, category, '999.00', 'expense', project=trip, is_deleted=True)
+            _add_transaction(test_user, category, '20.00', 'expense', project=house)
+            _add_transaction(test_user, category, '5.00', 'expense')  # No project
+            
+            stats = ProjectService.get_all_project_statistics(test_user.id)
+            
+            assert [s['project_name'] for s in stats] == ['Empty', 'House', 'Trip']
+            assert stats == [
+                ProjectService.get_project_statistics(project.id, test_user.id)
+                for project in (empty, house, trip)
+            ]
+            
+            trip_stats = stats[2]
+            assert trip_stats['total_income'] == 100.0
+            assert trip_stats['total_expenses'] == 55.5
+            assert trip_stats['net_spending'] == -44.5
+            assert trip_stats['transaction_count'] == 3
+            assert stats[0]['transaction_count'] == 0
+            assert stats[0]['total_expenses'] == 0.0
+    
+    def test_all_statistics_keyset_page(self, app, test_user, other_user):
+        """Test pages continue after the last name shown without gaps or repeats."""
+        with app.app_context():
+            for name in ('Alpha', 'Beta', 'Gamma'):
+                db.session.add(Project(name=name, user_id=test_user.id))
+            db.session.add(Project(name='Beta2', user_id=other_user.id))
+            db.session.commit()
+            
+            first = ProjectService.get_all_project_statistics(test_user.id, limit=2)
+            assert [s['project_name'] for s in first] == ['Alpha', 'Beta']
+            
+            second = ProjectService.get_all_project_statistics(
+                test_user.id, limit=2, after_name=first[-1]['project_name']
+            )
+            assert [s['project_name'] for s in second] == ['Gamma']
+
+
+class TestProjectListing:
+    """Test suite for project lists and pages."""
+    
+    def test_get_user_projects_keyset_page(self, app, test_user):
+        """Test keyset paging over active projects."""
+        with app.app_context():
+            for name in ('Alpha', 'Beta', 'Gamma', 'Delta'):
+                db.session.add(Project(name=name, user_id=test_user.id))
+            db.session.add(Project(name='Archived', user_id=test_user.id, is_active=False))
+            db.session.commit()
+            
+            first = ProjectService.get_user_projects(test_user.id, limit=2)
+            assert [p.name for p in first] == ['Alpha', 'Beta']
+            
+            rest = ProjectService.get_user_projects(test_user.id, limit=2, after_name='Beta')
+            assert [p.name for p in rest] == ['Delta', 'Gamma']
+            
+            assert ProjectService.get_user_projects(test_user.id, after_name='Gamma') == []
+    
+    def test_get_user_projects_page(self, app, test_user):
+        """Test a project page comes back with the full count."""
+        with app.app_context():
+            for name in ('Alpha', 'Beta', 'Gamma'):
+                db.session.add(Project(name=name, user_id=test_user.id))
+            db.session.add(Project(name='Archived', user_id=test_user.id, is_active=False))
+            db.session.commit()
+            
+            projects, total = ProjectService.get_user_projects_page(test_user.id, limit=2, offset=2)
+            assert [p.name for p in projects] == ['Beta', 'Gamma']
+            assert total == 4
+            
+            projects, total = ProjectService.get_user_projects_page(
+                test_user.id, limit=2, active_only=True
+            )
+            assert [p.name for p in projects] == ['Alpha', 'Beta']
+            assert total == 3
+            
+            projects, total = ProjectService.get_user_projects_page(test_user.id, limit=2, offset=10)
+            assert projects == []
+            assert total == 4
+
+
+class TestUpdateProject:
+    """Test suite for ProjectService.update_project."""
+    
+    def test_update_project(self, app, test_user):
+        """Test updating fields returns the updated project."""
+        with app.app_context():
+            project = ProjectService.create_project(test_user.id, 'Trip')
+            
+            updated = ProjectService.update_project(
+                project.id, test_user.id, name=' Holiday ', color='ff0000', is_active=False
+            )
+            
+            assert updated.id == project.id
+            assert updated.name == 'Holiday'
+            assert updated.color == '#ff0000'
+            assert updated.is_active is False
+            assert db.session.get(Project, project.id).name == 'Holiday'
+    
+    def test_update_project_duplicate_name(self, app, test_user):
+        """Test renaming onto an existing project name raises error."""
+        with app.app_context():
+            ProjectService.create_project(test_user.id, 'Trip')
+            house = ProjectService.create_project(test_user.id, 'House')
+            
+            with pytest.raises(ValueError, match='already exists'):
+                ProjectService.update_project(house.id, test_user.id, name='Trip')
+            
+            assert db.session.get(Project, house.id).name == 'House'
+    
+    def test_update_project_not_owned(self, app, test_user, other_user):
+        """Test another user's project can't be updated."""
+        with app.app_context():
+            project = ProjectService.create_project(other_user.id, 'Trip')
+            
+            with pytest.raises(ValueError, match='Project not found'):
+                ProjectService.update_project(project.id, test_user.id, name='Mine')
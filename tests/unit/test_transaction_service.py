@@ -0,0 +1,61 @@
+"""
+Unit tests for TransactionService.
+
+Why test services?
+- Business logic validation
+- Verify authorization checks (categories and projects belong to the user)
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from app import db
+from app.models.project import Project
+from app.services.transaction_service import TransactionService
+
+
+class TestTransactionService:
+    """Test suite for TransactionService."""
+    
+    def test_create_transaction_with_own_project(self, app, test_user, test_category):
+        """Test a transaction can be attached to the user's own project."""
+        with app.app_context():
+            project = Project(name='Trip', user_id=test_user.id)
+            db.session.add(project)
+            db.session.commit()
+            
+            transaction = TransactionService.create_transaction(
+                test_user.id, Decimal('10.00'), test_category.id, 'expense', date.today(),
+                project_id=project.id
+            )
+            
+            assert transaction.project_id == project.id
+    
+    def test_create_transaction_with_other_users_project(self, app, test_user, other_user, test_category):
+        """Test another user's project is rejected on create."""
+        with app.app_context():
+            project = Project(name='Trip', user_id=other_user.id)
+            db.session.add(project)
+            db.session.commit()
+            
+            with pytest.raises(ValueError, match='Project not found'):
+                TransactionService.create_transaction(
+                    test_user.id, Decimal('10.00'), test_category.id, 'expense', date.today(),
+                    project_id=project.id
+                )
+    
+    def test_update_transaction_with_other_users_project(self, app, test_user, other_user, test_category):
+        """Test another user's project is rejected on update."""
+        with app.app_context():
+            project = Project(name='Trip', user_id=other_user.id)
+            db.session.add(project)
+            db.session.commit()
+            
+            transaction = TransactionService.create_transaction(
+                test_user.id, Decimal('10.00'), test_category.id, 'expense', date.today()
+            )
+            
+            with pytest.raises(ValueError, match='Project not found'):
+                TransactionService.update_transaction(
+                    transaction.id, test_user.id, project_id=project.id
+                )
@@ -88,6 +88,51 @@ class TestUserModel:
             assert user.check_password('wrongpassword') is False
             assert user.check_password('CorrectPassword') is False  # Case sensitive
     
+    def test_authenticate(self, app):
+        """Test authenticate returns the user only for correct credentials."""
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('correctpassword')
+            db.session.add(user)
+            db.session.commit()
+            
+            assert User.authenticate('Test@Example.com', 'correctpassword') == user
+            assert User.authenticate('test@example.com', 'wrongpassword') is None
+            assert User.authenticate('nobody@example.com', 'correctpassword') is None
+    
+    def test_dummy_hash_cached_per_app(self, app):
+        """Test the unknown-email hash is built once per app with its own rounds."""
+        from app.models.user import init_dummy_hash
+        
+        with app.app_context():
+            dummy_hash = init_dummy_hash(app)
+            
+            assert app.extensions['login_dummy_hash'] == dummy_hash
+            assert dummy_hash.startswith(b'$2b$04$')  # TestingConfig rounds
+            assert User.authenticate('nobody@example.com', 'password') is None
+            assert app.extensions['login_dummy_hash'] == dummy_hash
+    
+    def test_legacy_password_hash_upgraded(self, app):
+        """
+        Test hashes from before SHA-256 pre-hashing still verify.
+        
+        Why this test?
+        - Existing users must be able to log in after the scheme change
+        - A successful check should upgrade the stored hash
+        """
+        from app import bcrypt
+        
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.password_hash = bcrypt.generate_password_hash('oldpassword', 4).decode('utf-8')
+            
+            assert user.check_password('wrongpassword') is False
+            assert user.check_password('oldpassword') is True
+            
+            # Hash upgraded to the pre-hash scheme
+            assert user.password_hash.startswith('sha256$')
+            assert user.check_password('oldpassword') is True
+    
     def test_unique_username(self, app):
         """
         Test username must be unique.
@@ -142,6 +187,23 @@ class TestUserModel:
             
             db.session.rollback()
     
+    def test_unique_email_case_insensitive(self, app):
+        """Test emails differing only by case are rejected."""
+        with app.app_context():
+            user1 = User(username='user1', email='test@example.com')
+            user1.set_password('password')
+            db.session.add(user1)
+            db.session.commit()
+            
+            user2 = User(username='user2', email='Test@Example.com')
+            user2.set_password('password')
+            db.session.add(user2)
+            
+            with pytest.raises(Exception):
+                db.session.commit()
+            
+            db.session.rollback()
+    
     def test_user_repr(self, app):
         """
         Test __repr__ method returns useful string.
@@ -227,3 +289,22 @@ class TestUserModel:
                 db.session.commit()
             
             db.session.rollback()
+    
+    def test_get_taken_fields(self, app):
+        """
+        Test username/email uniqueness check.
+        
+        Why this test?
+        - Signup relies on it to report which field is already in use
+        - Both fields are checked with a single query
+        """
+        with app.app_context():
+            user = User(username='testuser', email='test@example.com')
+            user.set_password('password')
+            db.session.add(user)
+            db.session.commit()
+            
+            assert User.get_taken_fields('newuser', 'new@example.com') == set()
+            assert User.get_taken_fields('testuser', 'new@example.com') == {'username'}
+            assert User.get_taken_fields('newuser', 'test@example.com') == {'email'}
+            assert User.get_taken_fields('testuser', 'test@example.com') == {'username', 'email'}